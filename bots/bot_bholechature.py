@@ -106,15 +106,67 @@ TIPS:
 import math
 import random
 
+# Module-level aliases: a global name lookup is cheaper than math.<attr> per call
+_sqrt = math.sqrt
+_cos = math.cos
+_sin = math.sin
+_atan2 = math.atan2
+_radians = math.radians
+_degrees = math.degrees
+_pi = math.pi
+_half_pi = math.pi * 0.5
+_random = random.random            # C-level; random.uniform/choice add a Python frame
+
+# sqrt(0.5): scales a sum of two unit vectors 90 degrees apart back to length 1
+SQRT_HALF = 0.7071067811865476
+
+# One unit direction vector per whole degree, used for random wandering
+UNIT_VECTORS = [(_cos(_radians(d)), _sin(_radians(d))) for d in range(360)]
+
+# Wall-avoidance turns as (cos, sin) of the rotation applied to the facing vector
+TURN_REVERSE = (-1.0, 0.0)                  # +180: emergency reverse
+TURN_LEFT = (0.0, -1.0)                     # -90: turn left
+TURN_RIGHT = (0.0, 1.0)                     # +90: turn right
+NUDGE_RIGHT = (SQRT_HALF, SQRT_HALF)        # +45: wall on left
+NUDGE_LEFT = (SQRT_HALF, -SQRT_HALF)        # -45: wall on right
+
+# Side-whisker reflex indexed by (left < 30) << 1 | (right < 30); left wins ties
+SIDE_AVOID_TURNS = (None, NUDGE_LEFT, NUDGE_RIGHT, NUDGE_RIGHT)
+
+# Squared range thresholds: compare against squared distances, no sqrt needed
+CLOSE_RANGE_SQ = 80 * 80            # Tanks practically touching
+ATTACK_RANGE_SQ = 200 * 200         # Close enough to shoot
+ENGAGE_RANGE_SQ = 250 * 250         # Juggernaut-mode engage radius
+JUGGERNAUT_FEAR_RADIUS_SQ = 300 * 300
+
+# Sticky enemy targeting: reuse the last target found, full rescan every few lookups
+TARGET_RESCAN_LOOKUPS = 4
+TARGET_CACHE = {"enemy_id": None, "lookups": 0}   # One bot module per tank, so per-tank
+
 
 def distance(x1, y1, x2, y2):
     """Calculate distance between two points."""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return _sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+
+
+def dist2(x1, y1, x2, y2):
+    """Squared distance between two points. Cheaper than distance() for comparisons."""
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
 
 
 def angle_to(x1, y1, x2, y2):
-    """Calculate angle from point (x1, y1) to point (x2, y2) in degrees. Returns -180° to +180°"""
-    return math.degrees(math.atan2(y2 - y1, x2 - x1))
+    """
+    Calculate angle from point (x1, y1) to point (x2, y2) in degrees. Returns -180° to +180°
+    Deprecated for direction math: use _angle_rad(). Kept for SHOOT angles, which the engine takes in degrees.
+    """
+    return _degrees(_atan2(y2 - y1, x2 - x1))
+
+
+def _angle_rad(x1, y1, x2, y2):
+    """Angle from (x1, y1) to (x2, y2) in radians, ready for cos/sin without a degrees round-trip."""
+    return _atan2(y2 - y1, x2 - x1)
 
 
 def find_nearest(my_x, my_y, targets):
@@ -123,16 +175,90 @@ def find_nearest(my_x, my_y, targets):
     Each target must have 'x' and 'y' keys.
     Returns (target, distance) or (None, float('inf')) if list is empty.
     """
-    nearest = None
-    min_dist = float('inf')
+    xs, ys = pack_xy(targets)
+    idx, d2 = find_nearest_xy(my_x, my_y, xs, ys)
+    if idx < 0:
+        return None, float('inf')
+    return targets[idx], _sqrt(d2)
+
+
+def avoid_walls(sf, sl, sr, my_angle):
+    """
+    Obstacle-avoidance reflex from the three sensor distances.
+    Returns a (dx, dy) direction to move in, or None if no wall is close.
+    """
+    side = (sl < 30) << 1 | (sr < 30)
+    if sf >= 50 and not side:
+        return None
+    
+    if sf < 10:
+        # EMERGENCY REVERSE: face-planted into wall (< 10 pixels)
+        c, s = TURN_REVERSE
+    elif sf < 50:
+        # STANDARD AVOIDANCE: wall approaching, turn toward the more open side
+        c, s = TURN_LEFT if sl > sr else TURN_RIGHT
+    else:
+        # Side whisker only - nudge away from that wall
+        c, s = SIDE_AVOID_TURNS[side]
+    
+    # Rotate the facing vector: one cos/sin pair, no per-branch trig
+    rad = _radians(my_angle)
+    ca = _cos(rad)
+    sa = _sin(rad)
+    return (ca * c - sa * s, sa * c + ca * s)
+
+
+def pack_xy(targets):
+    """
+    Flatten a list of {"x", "y"} dicts into two coordinate lists (xs, ys).
+    Build these ONCE per frame and reuse them for every nearest-target query.
+    """
+    return [t["x"] for t in targets], [t["y"] for t in targets]
+
+
+def find_nearest_xy(my_x, my_y, xs, ys):
+    """
+    Find the nearest point in flat coordinate lists.
+    Returns (index, squared_distance) or (-1, float('inf')) if lists are empty.
+    Uses squared distance (no sqrt) since only the ordering matters.
+    """
+    best = -1
+    min_dist2 = float('inf')
+    
+    for i in range(len(xs)):
+        dx = xs[i] - my_x
+        dy = ys[i] - my_y
+        d2 = dx * dx + dy * dy
+        if d2 < min_dist2:
+            min_dist2 = d2
+            best = i
+    
+    return best, min_dist2
+
+
+def find_nearest_enemy_cached(my_x, my_y, enemies):
+    """
+    Nearest-enemy lookup that keeps the previous lookup's target while it is
+    still alive, refreshing only its distance. Every TARGET_RESCAN_LOOKUPS calls
+    (not frames: a strategy may skip the lookup on some frames) a full scan runs
+    so a closer enemy can take over the target.
+    Returns (index, squared_distance) or (-1, float('inf')).
+    """
+    cache = TARGET_CACHE
+    lookups = cache["lookups"] + 1
+    cache["lookups"] = lookups
     
-    for target in targets:
-        dist = distance(my_x, my_y, target["x"], target["y"])
-        if dist < min_dist:
-            min_dist = dist
-            nearest = target
+    last_id = cache["enemy_id"]
+    if last_id is not None and lookups % TARGET_RESCAN_LOOKUPS:
+        for i, enemy in enumerate(enemies):
+            if enemy["id"] == last_id:
+                return i, dist2(my_x, my_y, enemy["x"], enemy["y"])
     
-    return nearest, min_dist
+    # Rescan: target died or the cache is due for a refresh
+    enemy_xs, enemy_ys = pack_xy(enemies)
+    idx, d2 = find_nearest_xy(my_x, my_y, enemy_xs, enemy_ys)
+    cache["enemy_id"] = enemies[idx]["id"] if idx >= 0 else None
+    return idx, d2
 
 
 def will_bullet_hit_me(my_x, my_y, bullet, danger_radius=50):
@@ -140,17 +266,54 @@ def will_bullet_hit_me(my_x, my_y, bullet, danger_radius=50):
     Predict if a bullet will come close to your position.
     Returns True if bullet is dangerous.
     """
+    return will_bullet_hit_me_xy(my_x, my_y, bullet["x"], bullet["y"],
+                                 bullet["vx"], bullet["vy"], danger_radius)
+
+
+def will_bullet_hit_me_xy(my_x, my_y, bx, by, bvx, bvy, danger_radius=50):
+    """Same test as will_bullet_hit_me(), on unpacked bullet position/velocity."""
     # Future position of bullet
     # Look ~10 frames ahead to estimate bullet direction (heuristic, not exact)
-    future_x = bullet["x"] + bullet["vx"] * 10
-    future_y = bullet["y"] + bullet["vy"] * 10
+    future_x = bx + bvx * 10
+    future_y = by + bvy * 10
     
     # Check if bullet path intersects with our position
-    dist_now = distance(my_x, my_y, bullet["x"], bullet["y"])
-    dist_future = distance(my_x, my_y, future_x, future_y)
+    # (squared distances: the ordering and threshold test are the same without sqrt)
+    dist_now2 = dist2(my_x, my_y, bx, by)
+    dist_future2 = dist2(my_x, my_y, future_x, future_y)
     
     # Bullet is approaching if it gets closer
-    return dist_future < dist_now and dist_now < danger_radius * 2
+    return dist_future2 < dist_now2 and dist_now2 < (danger_radius * 2) ** 2
+
+
+def first_dangerous_bullet(my_x, my_y, bxs, bys, bvxs, bvys, danger_radius=50, start=0):
+    """
+    Scan the packed bullet lists for the first bullet (from index `start`)
+    that will_bullet_hit_me_xy() would flag. Returns its index, or -1.
+    The whole test is inlined into one loop: no per-bullet call, no sqrt.
+    """
+    max_dist2 = (danger_radius * 2) ** 2
+    for i in range(start, len(bxs)):
+        dx = bxs[i] - my_x
+        dy = bys[i] - my_y
+        dist_now2 = dx * dx + dy * dy
+        if dist_now2 >= max_dist2:
+            continue
+        # Same 10-frame look-ahead as will_bullet_hit_me_xy()
+        fx = dx + bvxs[i] * 10
+        fy = dy + bvys[i] * 10
+        if fx * fx + fy * fy < dist_now2:
+            return i
+    return -1
+
+
+def pack_bullets(bullets):
+    """
+    Flatten the bullet list into four parallel lists (bx, by, bvx, bvy).
+    Build these ONCE per frame; index them instead of the bullet dicts.
+    """
+    return ([b["x"] for b in bullets], [b["y"] for b in bullets],
+            [b["vx"] for b in bullets], [b["vy"] for b in bullets])
 
 # =============================================================================
 # YOUR CODE STARTS HERE!
@@ -167,178 +330,216 @@ def update(context):
         (ACTION, PARAMETER) tuple - your tank's action for this frame as discussed above
     """
     
+    # One strategy per game mode: a single dict lookup instead of an if/elif chain
+    return MODE_UPDATES.get(context["game_mode"], _update_wander)(context)
+
+
+# =========================================================================
+# EXAMPLE STRATEGY: This is a basic bot, modify it!
+# =========================================================================
+
+def _update_wander(context):
+    """Unknown game mode: avoid walls and wander around."""
+    me = context["me"]
+    sensors = context["sensors"]
+
+    # PRIORITY 0: OBSTACLE AVOIDANCE REFLEX (Prevents getting stuck!)
+    avoid = avoid_walls(sensors["front"], sensors["left"], sensors["right"], me["angle"])
+    if avoid is not None:
+        return ("MOVE", avoid)
+
+    # Default: Wander around
+    return ("MOVE", UNIT_VECTORS[int(_random() * 360)])
+
+
+# =========================================================================
+# LEVEL 1 - THE SCRAMBLE
+# =========================================================================
+
+def _update_scramble(context): # Collect the coins
+
     # Get my tank's info
     me = context["me"]
     my_x = me["x"]
     my_y = me["y"]
+    my_ammo = me["ammo"]
     
     enemies = context["enemies"]
     coins = context["coins"]
     bullets = context["bullets"]
-    game_mode = context["game_mode"]
-    
-    # =========================================================================
-    # EXAMPLE STRATEGY: This is a basic bot, modify it!
-    # =========================================================================
-    
+
     # PRIORITY 0: OBSTACLE AVOIDANCE REFLEX (Prevents getting stuck!)
     # all info related to sensors is discussed above and is only to learn and not edit anything!
-
     sensors = context["sensors"]
-    my_angle = me["angle"]
-    
-    # EMERGENCY REVERSE: If face-planted into wall (< 10 pixels)
-    if sensors["front"] < 10:
-        # Full reverse! Move opposite to facing direction
-        reverse_angle = math.radians(my_angle + 180)
-        return ("MOVE", (math.cos(reverse_angle), math.sin(reverse_angle)))
-    
-    # STANDARD AVOIDANCE: Wall approaching (< 50 pixels)
-    elif sensors["front"] < 50:
-        # Turn toward open space
-        if sensors["left"] > sensors["right"]:
-            # More space on left - turn left (perpendicular to facing)
-            turn_angle = math.radians(my_angle - 90)
-        else:
-            # More space on right - turn right
-            turn_angle = math.radians(my_angle + 90)
-        dx = math.cos(turn_angle)
-        dy = math.sin(turn_angle)
-        return ("MOVE", (dx, dy))
-    
-    elif sensors["left"] < 30:
-        # Wall on left - nudge right
-        turn_angle = math.radians(my_angle + 45)
-        return ("MOVE", (math.cos(turn_angle), math.sin(turn_angle)))
-    
-    elif sensors["right"] < 30:
-        # Wall on right - nudge left
-        turn_angle = math.radians(my_angle - 45)
-        return ("MOVE", (math.cos(turn_angle), math.sin(turn_angle)))   
+    avoid = avoid_walls(sensors["front"], sensors["left"], sensors["right"], me["angle"])
+    if avoid is not None:
+        return ("MOVE", avoid)
     
     # note: If none of the conditions above trigger,
     # you must return your own action later (or tank will stop)
 
-    # =========================================================================
-    # LEVEL 1 - THE SCRAMBLE
-    # =========================================================================
-
-    if game_mode == 1: # Collect the coins
-
-        # Priority 1: Dodge incoming bullets (standard MOVE)
-        for bullet in bullets:
-            if will_bullet_hit_me(my_x, my_y, bullet):
-                bullet_angle =math.degrees(math.atan2(bullet["vy"],bullet["vx"]))
-                dodge_agl= bullet_angle + 90
-                return ("MOVE",(5*math.cos(math.radians(dodge_agl)),5*math.sin(math.radians(dodge_agl))))
-                #return ("MOVE",(dx,dy))
-
-        if coins:
-            nearest_coin, dist = find_nearest(my_x, my_y, coins)
-            if nearest_coin:
-                angle_coin=angle_to(my_x,my_y,nearest_coin["x"],nearest_coin["y"])
-                return ("MOVE",(10*math.cos(math.radians(angle_coin)),10*math.sin(math.radians(angle_coin))))
-                for enemy in enemies:
-                    enemy_dist = distance(enemy["x"], enemy["y"], nearest_coin["x"], nearest_coin["y"])
-                    my_dist = distance(my_x["x"], my_y["y"], nearest_coin["x"], nearest_coin["y"])
-                    if(enemy_dist<my_dist):
-                        return("SHOOT",angle_to(my_x,my_y,enemy["x"], enemy["y"]))
-                    # WRITE YOUR LOGIC HERE
-
-                    # # TIP: Compare enemy_dist with my_dist.
-                    # If an enemy is closer to this coin, you may want to shoot to knock them back first.
-                    # Also, don’t forget to move toward the coin!
-
-    # =========================================================================
-    # LEVEL 2 - THE LABYRINTH
-    # =========================================================================
-    
-    elif game_mode == 2: # Combat game
+    # Priority 1: Dodge incoming bullets (standard MOVE)
+    bullet_xs, bullet_ys, bullet_vxs, bullet_vys = pack_bullets(bullets)
+    i = first_dangerous_bullet(my_x, my_y, bullet_xs, bullet_ys, bullet_vxs, bullet_vys)
+    if i >= 0:
+        bullet_angle =_atan2(bullet_vys[i],bullet_vxs[i])
+        dodge_agl= bullet_angle + _half_pi
+        return ("MOVE",(5*_cos(dodge_agl),5*_sin(dodge_agl)))
+        #return ("MOVE",(dx,dy))
+
+    if coins:
+        # Pack target coordinates ONCE per frame, reused by every nearest-target query below
+        coin_xs, coin_ys = pack_xy(coins)
+        idx, my_coin_dist2 = find_nearest_xy(my_x, my_y, coin_xs, coin_ys)
+        nearest_coin = coins[idx] if idx >= 0 else None
+        if nearest_coin:
+            coin_x, coin_y = nearest_coin["x"], nearest_coin["y"]
+
+            # If an enemy is closer to this coin than we are, shoot to knock it back first.
+            # One scan over the packed enemy list finds the enemy nearest to the coin.
+            if my_ammo > 0:
+                enemy_xs, enemy_ys = pack_xy(enemies)
+                threat, threat_dist2 = find_nearest_xy(coin_x, coin_y, enemy_xs, enemy_ys)
+                if threat >= 0 and threat_dist2 < my_coin_dist2:
+                    return ("SHOOT", angle_to(my_x, my_y, enemy_xs[threat], enemy_ys[threat]))
+
+            # Otherwise move toward the coin
+            angle_coin=_angle_rad(my_x,my_y,coin_x,coin_y)
+            return ("MOVE",(10*_cos(angle_coin),10*_sin(angle_coin)))
 
-        # Priority 1: Dodge incoming bullets (standard MOVE)
-        for bullet in bullets:
-            if will_bullet_hit_me(my_x, my_y, bullet):
+    # Default: Wander around
+    return ("MOVE", UNIT_VECTORS[int(_random() * 360)])
 
-                # WRITE YOUR LOGIC HERE
-                
-                #return ("MOVE",(dx,dy))
-                pass
 
-        if enemies and me["ammo"] > 0:
-            # Find and attack nearest enemy
-            nearest_enemy, dist = find_nearest(my_x, my_y, enemies)
-            if nearest_enemy:
+# =========================================================================
+# LEVEL 2 - THE LABYRINTH
+# =========================================================================
 
-                if dist < 80:
-                    # What if the two tanks are stuck to each other (very close range)?
+def _update_labyrinth(context): # Combat game
 
-                    # WRITE YOUR LOGIC HERE (example: move away, strafe, or reposition)
-                    pass
+    # Get my tank's info
+    me = context["me"]
+    my_x = me["x"]
+    my_y = me["y"]
+    my_ammo = me["ammo"]
 
-                elif dist < 200:
-                     # Enemy in range — attack
-                    target_angle = angle_to(my_x, my_y, nearest_enemy["x"], nearest_enemy["y"])
-                    return ("SHOOT", target_angle)
-                
-                else:
-                    # TO-DO: If enemy is far, should you move toward it? flank it? or reposition?
-                    
-                    # note: If you don't return an action here, your tank will stop!
-                    pass
-
-    # =========================================================================
-    # LEVEL 3 - THE JUGGERNAUT
-    # =========================================================================
-    
-    elif game_mode == 3: # Juggernaut game
+    enemies = context["enemies"]
+    bullets = context["bullets"]
 
-        total_move_x = 0
-        total_move_y = 0
+    # PRIORITY 0: OBSTACLE AVOIDANCE REFLEX (Prevents getting stuck!)
+    sensors = context["sensors"]
+    avoid = avoid_walls(sensors["front"], sensors["left"], sensors["right"], me["angle"])
+    if avoid is not None:
+        return ("MOVE", avoid)
 
-        # A. Dodge Juggernaut
-        juggernaut = context.get("juggernaut")
-        if juggernaut:
-            jug_x, jug_y = juggernaut["x"], juggernaut["y"]
-            jug_dist = distance(my_x, my_y, jug_x, jug_y)
-            
-            if jug_dist < 300:  # Fear radius
-                # Vector away from Juggernaut
-                target_angle = angle_to(my_x, my_y, jug_x, jug_y)
-                new_angle=target_angle + 180
-                total_move_x += math.cos(math.radians(new_angle))
-                total_move_y+= math.sin(math.radians(new_angle))
-        
-        # B. Dodge Bullets
-        for bullet in bullets:
-            if will_bullet_hit_me(my_x, my_y, bullet):
-                # Perpendicular dodge
-                dodge_angle = math.degrees(math.atan2(bullet["vy"], bullet["vx"])) + 90
-                dx = math.cos(math.radians(dodge_angle))
-                dy = math.sin(math.radians(dodge_angle))
-                return ("MOVE", (dx, dy))
+    # Priority 1: Dodge incoming bullets (standard MOVE)
+    bullet_xs, bullet_ys, bullet_vxs, bullet_vys = pack_bullets(bullets)
+    i = first_dangerous_bullet(my_x, my_y, bullet_xs, bullet_ys, bullet_vxs, bullet_vys)
+    if i >= 0:
+
+        # WRITE YOUR LOGIC HERE
         
-        # C. Enemy logic
-        target_enemy = None
-        if enemies:
-            target_enemy, enemy_dist = find_nearest(my_x, my_y, enemies)
+        #return ("MOVE",(dx,dy))
+        pass
+
+    if enemies and my_ammo > 0:
+        # Find and attack nearest enemy
+        idx, enemy_dist2 = find_nearest_enemy_cached(my_x, my_y, enemies)
+        nearest_enemy = enemies[idx] if idx >= 0 else None
+        if nearest_enemy:
 
-            if enemy_dist < 250:
+            if enemy_dist2 < CLOSE_RANGE_SQ:
+                # What if the two tanks are stuck to each other (very close range)?
 
-                # WRITE YOUR LOGIC HERE
+                # WRITE YOUR LOGIC HERE (example: move away, strafe, or reposition)
                 pass
+
+            elif enemy_dist2 < ATTACK_RANGE_SQ:
+                 # Enemy in range — attack
+                target_angle = angle_to(my_x, my_y, nearest_enemy["x"], nearest_enemy["y"])
+                return ("SHOOT", target_angle)
+            
+            else:
+                # TO-DO: If enemy is far, should you move toward it? flank it? or reposition?
+                
+                # note: If you don't return an action here, your tank will stop!
+                pass
+
+    # Default: Wander around
+    return ("MOVE", UNIT_VECTORS[int(_random() * 360)])
+
+
+# =========================================================================
+# LEVEL 3 - THE JUGGERNAUT
+# =========================================================================
+
+def _update_juggernaut(context): # Juggernaut game
+
+    # Get my tank's info
+    me = context["me"]
+    my_x = me["x"]
+    my_y = me["y"]
+    my_ammo = me["ammo"]
+
+    enemies = context["enemies"]
+    bullets = context["bullets"]
+
+    # PRIORITY 0: OBSTACLE AVOIDANCE REFLEX (Prevents getting stuck!)
+    sensors = context["sensors"]
+    avoid = avoid_walls(sensors["front"], sensors["left"], sensors["right"], me["angle"])
+    if avoid is not None:
+        return ("MOVE", avoid)
+
+    total_move_x = 0
+    total_move_y = 0
+
+    # A. Dodge Juggernaut
+    juggernaut = context.get("juggernaut")
+    if juggernaut:
+        jug_x, jug_y = juggernaut["x"], juggernaut["y"]
+        jug_dist2 = dist2(my_x, my_y, jug_x, jug_y)
         
-        # Shooting
-        if target_enemy and me["ammo"] > 0:
-            shoot_angle = angle_to(my_x, my_y, target_enemy["x"], target_enemy["y"])
-            shoot_angle += random.uniform(-5, 5) # Slight spread
-            return ("SHOOT",shoot_angle)
-        
-        # Fallback: Just Move
-        return ("MOVE", (total_move_x, total_move_y))
+        if jug_dist2 < JUGGERNAUT_FEAR_RADIUS_SQ:  # Fear radius
+            # Vector away from Juggernaut
+            target_angle = _angle_rad(my_x, my_y, jug_x, jug_y)
+            new_angle=target_angle + _pi
+            total_move_x += _cos(new_angle)
+            total_move_y+= _sin(new_angle)
     
+    # B. Dodge Bullets
+    bullet_xs, bullet_ys, bullet_vxs, bullet_vys = pack_bullets(bullets)
+    i = first_dangerous_bullet(my_x, my_y, bullet_xs, bullet_ys, bullet_vxs, bullet_vys)
+    if i >= 0:
+        # Perpendicular dodge
+        dodge_angle = _atan2(bullet_vys[i], bullet_vxs[i]) + _half_pi
+        dx = _cos(dodge_angle)
+        dy = _sin(dodge_angle)
+        return ("MOVE", (dx, dy))
+    
+    # C. Enemy logic
+    target_enemy = None
+    if enemies:
+        idx, enemy_dist2 = find_nearest_enemy_cached(my_x, my_y, enemies)
+        target_enemy = enemies[idx]
 
-    # Default: Wander around
-    angle = random.uniform(0, 360)
-    dx = math.cos(math.radians(angle))
-    dy = math.sin(math.radians(angle))
-    return ("MOVE", (dx, dy))
\ No newline at end of file
+        if enemy_dist2 < ENGAGE_RANGE_SQ:
+
+            # WRITE YOUR LOGIC HERE
+            pass
+    
+    # Shooting
+    if target_enemy and my_ammo > 0:
+        shoot_angle = angle_to(my_x, my_y, target_enemy["x"], target_enemy["y"])
+        shoot_angle += 10 * _random() - 5 # Slight spread
+        return ("SHOOT",shoot_angle)
+    
+    # Fallback: Just Move
+    return ("MOVE", (total_move_x, total_move_y))
+
+
+# One strategy per game mode; update() dispatches on context["game_mode"]
+MODE_UPDATES = {
+    1: _update_scramble,
+    2: _update_labyrinth,
+    3: _update_juggernaut,
+}
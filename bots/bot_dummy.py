@@ -1,254 +1,350 @@
 import math
 import random
 
-def distance(x1, y1, x2, y2):
-    """Calculate distance between two points."""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+# Module-level aliases: a global name lookup is cheaper than math.<attr> per call
+_sqrt = math.sqrt
+_cos = math.cos
+_sin = math.sin
+_atan2 = math.atan2
+_radians = math.radians
+_degrees = math.degrees
+_pi = math.pi
+_half_pi = math.pi * 0.5
+_random = random.random            # C-level; random.uniform/choice add a Python frame
+
+# sqrt(0.5): scales a sum of two unit vectors 90 degrees apart back to length 1
+SQRT_HALF = 0.7071067811865476
+
+# One unit direction vector per whole degree, used for random wandering
+UNIT_VECTORS = [(_cos(_radians(d)), _sin(_radians(d))) for d in range(360)]
+
+# Wall-avoidance turns as (cos, sin) of the rotation applied to the facing vector
+TURN_REVERSE = (-1.0, 0.0)                  # +180: emergency reverse
+TURN_LEFT = (0.0, -1.0)                     # -90: turn left
+TURN_RIGHT = (0.0, 1.0)                     # +90: turn right
+NUDGE_RIGHT = (SQRT_HALF, SQRT_HALF)        # +45: wall on left
+NUDGE_LEFT = (SQRT_HALF, -SQRT_HALF)        # -45: wall on right
+
+# Side-whisker reflex indexed by (left < 30) << 1 | (right < 30); left wins ties
+SIDE_AVOID_TURNS = (None, NUDGE_LEFT, NUDGE_RIGHT, NUDGE_RIGHT)
+
+# Squared range threshold: compare against squared distances, no sqrt needed
+JUGGERNAUT_FEAR_RADIUS_SQ = 300 * 300
+
+# Sticky enemy targeting: reuse the last target found, full rescan every few lookups
+TARGET_RESCAN_LOOKUPS = 4
+TARGET_CACHE = {"enemy_id": None, "lookups": 0}   # One bot module per tank, so per-tank
+
+def dist2(x1, y1, x2, y2):
+    """Squared distance between two points (no sqrt: enough for comparisons)."""
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
+
+def _norm(dx, dy):
+    """Unit vector along (dx, dy): one sqrt and two multiplies. (0, 0) stays (0, 0)."""
+    s = dx * dx + dy * dy
+    if s == 0.0:
+        return dx, dy
+    inv = 1.0 / _sqrt(s)
+    return dx * inv, dy * inv
 
 def angle_to(x1, y1, x2, y2):
-    """Calculate angle from point (x1, y1) to point (x2, y2) in degrees. Returns -180° to +180°"""
-    return math.degrees(math.atan2(y2 - y1, x2 - x1))
+    """
+    Calculate angle from point (x1, y1) to point (x2, y2) in degrees. Returns -180° to +180°
+    Deprecated for direction math: use _angle_rad(). Kept for SHOOT angles, which the engine takes in degrees.
+    """
+    return _degrees(_atan2(y2 - y1, x2 - x1))
+
+def _angle_rad(x1, y1, x2, y2):
+    """Angle from (x1, y1) to (x2, y2) in radians, ready for cos/sin without a degrees round-trip."""
+    return _atan2(y2 - y1, x2 - x1)
+
+def avoid_walls(sf, sl, sr, my_angle):
+    """
+    Obstacle-avoidance reflex from the three sensor distances.
+    Returns a (dx, dy) direction to move in, or None if no wall is close.
+    """
+    side = (sl < 30) << 1 | (sr < 30)
+    if sf >= 50 and not side:
+        return None
+    
+    if sf < 10:
+        # EMERGENCY REVERSE: face-planted into wall (< 10 pixels)
+        c, s = TURN_REVERSE
+    elif sf < 50:
+        # STANDARD AVOIDANCE: wall approaching, turn toward the more open side
+        c, s = TURN_LEFT if sl > sr else TURN_RIGHT
+    else:
+        # Side whisker only - nudge away from that wall
+        c, s = SIDE_AVOID_TURNS[side]
+    
+    # Rotate the facing vector: one cos/sin pair, no per-branch trig
+    rad = _radians(my_angle)
+    ca = _cos(rad)
+    sa = _sin(rad)
+    return (ca * c - sa * s, sa * c + ca * s)
 
-def find_nearest(my_x, my_y, targets):
+def pack_xy(targets):
+    """Flatten a list of {"x", "y"} dicts into two coordinate lists (xs, ys)."""
+    return [t["x"] for t in targets], [t["y"] for t in targets]
+
+def find_nearest_xy(my_x, my_y, xs, ys):
     """
-    Find the nearest target from a list of targets.
-    Each target must have 'x' and 'y' keys.
-    Returns (target, distance) or (None, float('inf')) if list is empty.
+    Find the nearest point in flat coordinate lists.
+    Returns (index, squared_distance) or (-1, float('inf')) if lists are empty.
     """
-    nearest = None
-    min_dist = float('inf')
+    best = -1
+    min_dist2 = float('inf')
     
-    for target in targets:
-        dist = distance(my_x, my_y, target["x"], target["y"])
-        if dist < min_dist:
-            min_dist = dist
-            nearest = target
+    for i in range(len(xs)):
+        dx = xs[i] - my_x
+        dy = ys[i] - my_y
+        d2 = dx * dx + dy * dy
+        if d2 < min_dist2:
+            min_dist2 = d2
+            best = i
     
-    return nearest, min_dist
+    return best, min_dist2
 
-def will_bullet_hit_me(my_x, my_y, bullet, danger_radius=50):
+def find_nearest_enemy_cached(my_x, my_y, enemies):
     """
-    Predict if a bullet will come close to your position.
-    Returns True if bullet is dangerous.
+    Nearest-enemy lookup that keeps the previous lookup's target while it is
+    still alive, refreshing only its distance. Every TARGET_RESCAN_LOOKUPS calls
+    (not frames: a strategy may skip the lookup on some frames) a full scan runs
+    so a closer enemy can take over the target.
+    Returns (index, squared_distance) or (-1, float('inf')).
     """
-    # Future position of bullet
-    # Look ~10 frames ahead to estimate bullet direction (heuristic, not exact)
-    future_x = bullet["x"] + bullet["vx"] * 10
-    future_y = bullet["y"] + bullet["vy"] * 10
+    cache = TARGET_CACHE
+    lookups = cache["lookups"] + 1
+    cache["lookups"] = lookups
     
-    # Check if bullet path intersects with our position
-    dist_now = distance(my_x, my_y, bullet["x"], bullet["y"])
-    dist_future = distance(my_x, my_y, future_x, future_y)
+    last_id = cache["enemy_id"]
+    if last_id is not None and lookups % TARGET_RESCAN_LOOKUPS:
+        for i, enemy in enumerate(enemies):
+            if enemy["id"] == last_id:
+                return i, dist2(my_x, my_y, enemy["x"], enemy["y"])
     
-    # Bullet is approaching if it gets closer
-    return dist_future < dist_now and dist_now < danger_radius * 2
+    # Rescan: target died or the cache is due for a refresh
+    enemy_xs, enemy_ys = pack_xy(enemies)
+    idx, d2 = find_nearest_xy(my_x, my_y, enemy_xs, enemy_ys)
+    cache["enemy_id"] = enemies[idx]["id"] if idx >= 0 else None
+    return idx, d2
+
+def first_dangerous_bullet(my_x, my_y, bxs, bys, bvxs, bvys, danger_radius=50, start=0):
+    """
+    Scan the packed bullet lists for the first bullet (from index `start`)
+    that is within 2 * danger_radius and getting closer. Returns its index, or -1.
+    The whole test is inlined into one loop: no per-bullet call, no sqrt.
+    """
+    max_dist2 = (danger_radius * 2) ** 2
+    for i in range(start, len(bxs)):
+        dx = bxs[i] - my_x
+        dy = bys[i] - my_y
+        dist_now2 = dx * dx + dy * dy
+        if dist_now2 >= max_dist2:
+            continue
+        # Look ~10 frames ahead: the bullet is approaching if it gets closer
+        fx = dx + bvxs[i] * 10
+        fy = dy + bvys[i] * 10
+        if fx * fx + fy * fy < dist_now2:
+            return i
+    return -1
+
+def pack_bullets(bullets):
+    """
+    Flatten the bullet list into four parallel lists (bx, by, bvx, bvy).
+    Build these ONCE per frame; index them instead of the bullet dicts.
+    """
+    return ([b["x"] for b in bullets], [b["y"] for b in bullets],
+            [b["vx"] for b in bullets], [b["vy"] for b in bullets])
 
 def update(context):
+    # One strategy per game mode: a single dict lookup instead of an if/elif chain
+    return MODE_UPDATES.get(context["game_mode"], _update_wander)(context)
+
+def _update_wander(context):
+    me = context["me"]
+    sensors = context["sensors"]
+
+    # PRIORITY 0: OBSTACLE AVOIDANCE REFLEX (Prevents getting stuck!)
+    avoid = avoid_walls(sensors["front"], sensors["left"], sensors["right"], me["angle"])
+    if avoid is not None:
+        return ("MOVE", avoid)
+
+    # Default: Wander around
+    return ("MOVE", UNIT_VECTORS[int(_random() * 360)])
+
+def _update_scramble(context):
     
     # Get my tank's info
     me = context["me"]
     my_x = me["x"]
     my_y = me["y"]
+    my_ammo = me["ammo"]
     
     enemies = context["enemies"]
     coins = context["coins"]
-    bullets = context["bullets"]
-    game_mode = context["game_mode"]
     
     # PRIORITY 0: OBSTACLE AVOIDANCE REFLEX (Prevents getting stuck!)
-
     sensors = context["sensors"]
-    my_angle = me["angle"]
-    
-    # EMERGENCY REVERSE: If face-planted into wall (< 10 pixels)
-    if sensors["front"] < 10:
-        # Full reverse! Move opposite to facing direction
-        reverse_angle = math.radians(my_angle + 180)
-        return ("MOVE", (math.cos(reverse_angle), math.sin(reverse_angle)))
-    
-    # STANDARD AVOIDANCE: Wall approaching (< 50 pixels)
-    elif sensors["front"] < 50:
-        # Turn toward open space
-        if sensors["left"] > sensors["right"]:
-            # More space on left - turn left (perpendicular to facing)
-            turn_angle = math.radians(my_angle - 90)
-        else:
-            # More space on right - turn right
-            turn_angle = math.radians(my_angle + 90)
-        dx = math.cos(turn_angle)
-        dy = math.sin(turn_angle)
-        return ("MOVE", (dx, dy))
-    
-    elif sensors["left"] < 30:
-        # Wall on left - nudge right
-        turn_angle = math.radians(my_angle + 45)
-        return ("MOVE", (math.cos(turn_angle), math.sin(turn_angle)))
-    
-    elif sensors["right"] < 30:
-        # Wall on right - nudge left
-        turn_angle = math.radians(my_angle - 45)
-        return ("MOVE", (math.cos(turn_angle), math.sin(turn_angle)))   
+    avoid = avoid_walls(sensors["front"], sensors["left"], sensors["right"], me["angle"])
+    if avoid is not None:
+        return ("MOVE", avoid)
+
+    r = _random()
+
+    # 40% - Pure random wandering
+    if r < 0.4:
+        return ("MOVE", UNIT_VECTORS[int(_random() * 360)])
+
+    # 30% - Move toward nearest coin
+    elif r < 0.7 and coins:
+        coin_xs, coin_ys = pack_xy(coins)
+        idx, _ = find_nearest_xy(my_x, my_y, coin_xs, coin_ys)
+        if idx >= 0:
+            nearest_coin = coins[idx]
+            dx, dy = _norm(nearest_coin["x"] - my_x, nearest_coin["y"] - my_y)
+            return ("MOVE", (dx, dy))
 
+    # 30% - Drift toward enemy + shoot
+    elif enemies:
+        enemy_xs, enemy_ys = pack_xy(enemies)
+        idx, _ = find_nearest_xy(my_x, my_y, enemy_xs, enemy_ys)
+        enemy = enemies[idx]
 
-    if game_mode == 1:
+        dx, dy = _norm(enemy["x"] - my_x, enemy["y"] - my_y)
 
-        r = random.random()
+        # Half the time move closer
+        if _random() < 0.1:
+            return ("MOVE", (dx, dy))
 
-        # 40% - Pure random wandering
-        if r < 0.4:
-            angle = random.uniform(0, 360)
-            return ("MOVE", (
-                math.cos(math.radians(angle)),
-                math.sin(math.radians(angle))
-            ))
+        # Half the time shoot (slightly inaccurate)
+        if my_ammo > 0:
+            shoot_angle = angle_to(my_x, my_y, enemy["x"], enemy["y"])
+            shoot_angle += 200 * _random() - 100
+            return ("SHOOT", shoot_angle)
 
-        # 30% - Move toward nearest coin
-        elif r < 0.7 and coins:
-            nearest_coin, _ = find_nearest(my_x, my_y, coins)
-            if nearest_coin:
-                dx = nearest_coin["x"] - my_x
-                dy = nearest_coin["y"] - my_y
-                length = math.hypot(dx, dy)
-                if length > 0:
-                    dx /= length
-                    dy /= length
-                return ("MOVE", (dx, dy))
-
-        # 30% - Drift toward enemy + shoot
-        elif enemies:
-            enemy, _ = find_nearest(my_x, my_y, enemies)
-
-            dx = enemy["x"] - my_x
-            dy = enemy["y"] - my_y
-            length = math.hypot(dx, dy)
-            if length > 0:
-                dx /= length
-                dy /= length
-
-            # Half the time move closer
-            if random.random() < 0.1:
-                return ("MOVE", (dx, dy))
-
-            # Half the time shoot (slightly inaccurate)
-            if me["ammo"] > 0:
-                shoot_angle = angle_to(my_x, my_y, enemy["x"], enemy["y"])
-                shoot_angle += random.uniform(-100, 100)
-                return ("SHOOT", shoot_angle)
-
-        # Fallback random move
-        angle = random.uniform(0, 360)
-        return ("MOVE", (
-            math.cos(math.radians(angle)),
-            math.sin(math.radians(angle))
-        ))
-    
-    elif game_mode == 2:
+    # Fallback random move
+    return ("MOVE", UNIT_VECTORS[int(_random() * 360)])
 
-        r = random.random()
+def _update_labyrinth(context):
 
-        # 50% - Random wandering
-        if r < 0.5:
-            angle = random.uniform(0, 360)
-            return ("MOVE", (
-                math.cos(math.radians(angle)),
-                math.sin(math.radians(angle))
-            ))
+    # Get my tank's info
+    me = context["me"]
+    my_x = me["x"]
+    my_y = me["y"]
+    my_ammo = me["ammo"]
 
-        # 25% - Move toward nearest enemy
-        elif r < 0.75 and enemies:
-            enemy, _ = find_nearest(my_x, my_y, enemies)
+    enemies = context["enemies"]
 
-            dx = enemy["x"] - my_x
-            dy = enemy["y"] - my_y
-            length = math.hypot(dx, dy)
-            if length > 0:
-                dx /= length
-                dy /= length
+    # PRIORITY 0: OBSTACLE AVOIDANCE REFLEX (Prevents getting stuck!)
+    sensors = context["sensors"]
+    avoid = avoid_walls(sensors["front"], sensors["left"], sensors["right"], me["angle"])
+    if avoid is not None:
+        return ("MOVE", avoid)
 
-            return ("MOVE", (dx, dy))
+    r = _random()
 
-        # 25% - Shoot nearest enemy (slightly inaccurate)
-        elif enemies and me["ammo"] > 0:
-            enemy, _ = find_nearest(my_x, my_y, enemies)
+    # 50% - Random wandering
+    if r < 0.5:
+        return ("MOVE", UNIT_VECTORS[int(_random() * 360)])
 
-            shoot_angle = angle_to(my_x, my_y, enemy["x"], enemy["y"])
-            shoot_angle += random.uniform(-8, 8)
+    # 25% - Move toward nearest enemy
+    elif r < 0.75 and enemies:
+        idx, _ = find_nearest_enemy_cached(my_x, my_y, enemies)
+        enemy = enemies[idx]
 
-            return ("SHOOT", shoot_angle)
+        dx, dy = _norm(enemy["x"] - my_x, enemy["y"] - my_y)
 
-        # Fallback random move
-        angle = random.uniform(0, 360)
-        return ("MOVE", (
-            math.cos(math.radians(angle)),
-            math.sin(math.radians(angle))
-        ))
-    
-    elif game_mode == 3:
-
-        # 1. Always avoid Juggernaut if nearby
-        juggernaut = context.get("juggernaut")
-        if juggernaut:
-            jug_x, jug_y = juggernaut["x"], juggernaut["y"]
-            jug_dist = distance(my_x, my_y, jug_x, jug_y)
-
-            if jug_dist < 300:
-                # Run directly away
-                away_angle = angle_to(my_x, my_y, jug_x, jug_y) + 180
-                return ("MOVE", (
-                    math.cos(math.radians(away_angle)),
-                    math.sin(math.radians(away_angle))
-                ))
-            
-        for bullet in bullets:
-            if will_bullet_hit_me(my_x, my_y, bullet) and random.random() < 0.5:
-                dodge_angle = math.degrees(math.atan2(bullet["vy"], bullet["vx"])) + 90
-                return ("MOVE", (
-                    math.cos(math.radians(dodge_angle)),
-                    math.sin(math.radians(dodge_angle))
-                ))
-        
-        r = random.random()
+        return ("MOVE", (dx, dy))
+
+    # 25% - Shoot nearest enemy (slightly inaccurate)
+    elif enemies and my_ammo > 0:
+        idx, _ = find_nearest_enemy_cached(my_x, my_y, enemies)
+        enemy = enemies[idx]
+
+        shoot_angle = angle_to(my_x, my_y, enemy["x"], enemy["y"])
+        shoot_angle += 16 * _random() - 8
+
+        return ("SHOOT", shoot_angle)
+
+    # Fallback random move
+    return ("MOVE", UNIT_VECTORS[int(_random() * 360)])
+
+def _update_juggernaut(context):
+
+    # Get my tank's info
+    me = context["me"]
+    my_x = me["x"]
+    my_y = me["y"]
+    my_ammo = me["ammo"]
+
+    enemies = context["enemies"]
+    bullets = context["bullets"]
 
-        # 40% - Random wandering
-        if r < 0.4:
-            angle = random.uniform(0, 360)
+    # PRIORITY 0: OBSTACLE AVOIDANCE REFLEX (Prevents getting stuck!)
+    sensors = context["sensors"]
+    avoid = avoid_walls(sensors["front"], sensors["left"], sensors["right"], me["angle"])
+    if avoid is not None:
+        return ("MOVE", avoid)
+
+    # 1. Always avoid Juggernaut if nearby
+    juggernaut = context.get("juggernaut")
+    if juggernaut:
+        jug_x, jug_y = juggernaut["x"], juggernaut["y"]
+        jug_dist2 = dist2(my_x, my_y, jug_x, jug_y)
+
+        if jug_dist2 < JUGGERNAUT_FEAR_RADIUS_SQ:
+            # Run directly away
+            away_angle = _angle_rad(my_x, my_y, jug_x, jug_y) + _pi
             return ("MOVE", (
-                math.cos(math.radians(angle)),
-                math.sin(math.radians(angle))
+                _cos(away_angle),
+                _sin(away_angle)
             ))
+        
+    # Each dangerous bullet gets its own 50% dodge roll
+    bullet_xs, bullet_ys, bullet_vxs, bullet_vys = pack_bullets(bullets)
+    i = first_dangerous_bullet(my_x, my_y, bullet_xs, bullet_ys, bullet_vxs, bullet_vys)
+    while i >= 0:
+        if _random() < 0.5:
+            dodge_angle = _atan2(bullet_vys[i], bullet_vxs[i]) + _half_pi
+            return ("MOVE", (
+                _cos(dodge_angle),
+                _sin(dodge_angle)
+            ))
+        i = first_dangerous_bullet(my_x, my_y, bullet_xs, bullet_ys, bullet_vxs, bullet_vys, start=i + 1)
+    
+    r = _random()
 
-        # 30% - Move toward nearest enemy
-        elif r < 0.7 and enemies:
-            enemy, _ = find_nearest(my_x, my_y, enemies)
+    # 40% - Random wandering
+    if r < 0.4:
+        return ("MOVE", UNIT_VECTORS[int(_random() * 360)])
 
-            dx = enemy["x"] - my_x
-            dy = enemy["y"] - my_y
-            length = math.hypot(dx, dy)
-            if length > 0:
-                dx /= length
-                dy /= length
+    # 30% - Move toward nearest enemy
+    elif r < 0.7 and enemies:
+        idx, _ = find_nearest_enemy_cached(my_x, my_y, enemies)
+        enemy = enemies[idx]
 
-            return ("MOVE", (dx, dy))
+        dx, dy = _norm(enemy["x"] - my_x, enemy["y"] - my_y)
 
-        # 30% - Shoot nearest enemy (light accuracy)
-        elif enemies and me["ammo"] > 0:
-            enemy, _ = find_nearest(my_x, my_y, enemies)
+        return ("MOVE", (dx, dy))
 
-            shoot_angle = angle_to(my_x, my_y, enemy["x"], enemy["y"])
-            shoot_angle += random.uniform(-8, 8)
-            return ("SHOOT", shoot_angle)
+    # 30% - Shoot nearest enemy (light accuracy)
+    elif enemies and my_ammo > 0:
+        idx, _ = find_nearest_enemy_cached(my_x, my_y, enemies)
+        enemy = enemies[idx]
 
-        # Fallback random move
-        angle = random.uniform(0, 360)
-        return ("MOVE", (
-            math.cos(math.radians(angle)),
-            math.sin(math.radians(angle))
-        ))
+        shoot_angle = angle_to(my_x, my_y, enemy["x"], enemy["y"])
+        shoot_angle += 16 * _random() - 8
+        return ("SHOOT", shoot_angle)
 
-    
+    # Fallback random move
+    return ("MOVE", UNIT_VECTORS[int(_random() * 360)])
 
-    # Default: Wander around
-    angle = random.uniform(0, 360)
-    dx = math.cos(math.radians(angle))
-    dy = math.sin(math.radians(angle))
-    return ("MOVE", (dx, dy))
\ No newline at end of file
+# One strategy per game mode; update() dispatches on context["game_mode"]
+MODE_UPDATES = {
+    1: _update_scramble,
+    2: _update_labyrinth,
+    3: _update_juggernaut,
+}
@@ -79,6 +79,9 @@ Max range is 300 pixels. If no wall is detected, the value is 300.
 - If the sensor sees a wall at 50px, it returns 50.
 - If it sees nothing (or the wall is too far), it returns 300.
 
+If your bot never reads sensors, add USES_SENSORS = False at the top of
+this file: the game then skips the raycasts and context["sensors"] is None.
+
 Example Usage:
     sensors = context["sensors"]
     if sensors["front"] < 50:  # Wall is close ahead!
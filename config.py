@@ -32,7 +32,7 @@ COLOR_GRID = (20, 40, 80)           # Faint neon blue grid
 COLOR_GRID_ACCENT = (30, 60, 120)   # Brighter grid accents
 
 # Tank Colors (Neon)
-TANK_COLORS = [
+TANK_COLORS = (
     (0, 255, 255),    # Cyan
     (255, 0, 255),    # Magenta
     (0, 255, 128),    # Lime Green
@@ -41,7 +41,7 @@ TANK_COLORS = [
     (128, 0, 255),    # Purple
     (255, 64, 128),   # Pink
     (0, 200, 255),    # Sky Blue
-]
+)
 
 # UI Colors
 COLOR_TEXT = (255, 255, 255)
@@ -90,6 +90,7 @@ PARTICLE_DEATH_SPEED = 8.0          # Initial velocity
 PARTICLE_FRICTION = 0.92            # Velocity decay per frame
 PARTICLE_FADE_SPEED = 5             # Alpha decrease per frame
 PARTICLE_SIZE_RANGE = (4, 12)       # Min/max particle size
+PARTICLE_SIZE_RANGE_LO, PARTICLE_SIZE_RANGE_HI = PARTICLE_SIZE_RANGE
 
 MUZZLE_FLASH_SIZE = 20
 MUZZLE_FLASH_DURATION = 5           # Frames
@@ -123,6 +124,7 @@ DANGER_ZONE_SPAWN_INTERVAL = 10.0   # Seconds between spawns
 DANGER_ZONE_WARNING_DURATION = 2.0  # Warning phase (time to escape)
 DANGER_ZONE_ACTIVE_DURATION = 5.0   # Active bombardment phase
 DANGER_ZONE_RADIUS = 120            # Size of the circle
+DANGER_ZONE_RADIUS_SQ = DANGER_ZONE_RADIUS ** 2   # For squared-distance hit checks
 DANGER_ZONE_DAMAGE = 75             # Damage per blast hit
 DANGER_ZONE_KNOCKBACK = 40.0       # Knockback force from blasts
 DANGER_ZONE_BLAST_INTERVAL = 0.5    # Seconds between explosions
@@ -11,7 +11,7 @@ Run with: python main.py
 PERFORMANCE OPTIMIZED:
 - Pre-rendered glow surfaces
 - Direct drawing instead of per-frame surface creation
-- Efficient trail rendering using pygame.draw.aalines
+- Bullet trails as three plain 2px pygame.draw.lines polylines, fading in thirds
 """
 
 import pygame
@@ -21,9 +21,10 @@ import copy
 import time
 import os
 import sys
+import glob
 import importlib.util
-from dataclasses import dataclass, field
-from typing import List, Tuple, Dict, Optional, Callable
+from collections import deque
+from typing import List, Tuple, Dict, Optional, Callable, Deque
 from config import *
 
 # Initialize Pygame
@@ -57,12 +58,19 @@ SFX_WIN_1 = load_sound("win1.mp3")
 SFX_WIN_2 = load_sound("win2.mp3")
 SFX_WIN_3 = load_sound("win3.mp3")
 
+# Last volume set on each sound (keyed by id - the SFX objects live for the whole program)
+SOUND_VOLUMES: Dict[int, float] = {}
+
 def play_sound(sound: Optional[pygame.mixer.Sound], volume: float = SFX_VOLUME, pitch_variation: bool = False):
     """Play a sound with optional pitch variation."""
     if sound is None:
         return
     
-    sound.set_volume(volume)
+    # Only touch the mixer's volume when it actually changes
+    key = id(sound)
+    if SOUND_VOLUMES.get(key) != volume:
+        sound.set_volume(volume)
+        SOUND_VOLUMES[key] = volume
     sound.play()
 
 # Reserve channel 0 for critical sounds (win, ready) that should NEVER be cut off
@@ -74,6 +82,7 @@ def play_critical_sound(sound: Optional[pygame.mixer.Sound], volume: float = 1.0
         return
     
     sound.set_volume(volume)
+    SOUND_VOLUMES[id(sound)] = volume
     CRITICAL_CHANNEL.play(sound)
 
 def start_background_music():
@@ -92,22 +101,77 @@ def start_background_music():
 # PRE-RENDERED SURFACES (Performance Optimization)
 # =============================================================================
 
-# Create reusable glow surfaces at startup
-def create_glow_surface(size: int, color: Tuple[int, int, int], alpha: int = 100) -> pygame.Surface:
-    """Create a pre-rendered glow surface."""
-    surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-    pygame.draw.circle(surf, (*color, alpha), (size, size), size)
-    return surf
+# Pre-rendered bullet sprites (glow + core + white center in one surface)
+BULLET_SPRITE_CACHE: Dict[Tuple[Tuple[int, int, int], bool], Tuple[pygame.Surface, int]] = {}
+
+def get_bullet_sprite(color: Tuple[int, int, int], is_critical: bool) -> Tuple[pygame.Surface, int]:
+    """Get or create a cached bullet sprite. Returns (sprite, offset from bullet center to sprite corner)."""
+    key = (color, is_critical)
+    cached = BULLET_SPRITE_CACHE.get(key)
+    if cached is None:
+        glow_size = BULLET_SIZE * 2 if is_critical else BULLET_SIZE + 2
+        glow_color = tuple(max(0, c - 100) for c in color)  # Darker glow
+        half = glow_size + 1
+        surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        center = (half, half)
+        pygame.draw.circle(surf, glow_color, center, glow_size)
+        pygame.draw.circle(surf, color, center, BULLET_SIZE)
+        pygame.draw.circle(surf, (255, 255, 255), center, BULLET_SIZE // 2)
+        cached = BULLET_SPRITE_CACHE[key] = (surf.convert_alpha(), half)
+    return cached
+
+# Tank bodies pre-rotated every TANK_SPRITE_STEP degrees, shared by all tanks of one color
+TANK_SPRITE_STEP = 5
+TANK_SPRITE_COUNT = 360 // TANK_SPRITE_STEP
+TANK_SPRITE_CACHE: Dict[Tuple[int, int, int], List[Tuple[pygame.Surface, int, int]]] = {}
+
+def get_tank_sprites(color: Tuple[int, int, int]) -> List[Tuple[pygame.Surface, int, int]]:
+    """
+    Get or create the rotated tank bodies for a color.
+    Entry i is the body at i * TANK_SPRITE_STEP degrees, as
+    (sprite, half width, half height) for blitting centered.
+    """
+    cached = TANK_SPRITE_CACHE.get(color)
+    if cached is None:
+        base = pygame.Surface((TANK_SIZE, TANK_SIZE), pygame.SRCALPHA)
+        pygame.draw.rect(base, color, (2, 2, TANK_SIZE - 4, TANK_SIZE - 4), border_radius=5)
+        pygame.draw.rect(base, (255, 255, 255), (2, 2, TANK_SIZE - 4, TANK_SIZE - 4), 2, border_radius=5)
+        cached = []
+        for i in range(TANK_SPRITE_COUNT):
+            rotated = pygame.transform.rotate(base, -i * TANK_SPRITE_STEP).convert_alpha()
+            cached.append((rotated, rotated.get_width() // 2, rotated.get_height() // 2))
+        TANK_SPRITE_CACHE[color] = cached
+    return cached
+
+# Pre-rendered walls (glow + fill + border), keyed by size: maze walls share a few sizes
+WALL_SPRITE_CACHE: Dict[Tuple[int, int], pygame.Surface] = {}
+
+def get_wall_sprite(width: int, height: int) -> pygame.Surface:
+    """Get or create a cached wall sprite; it includes the 3px glow, so blit at (x - 3, y - 3)."""
+    key = (width, height)
+    cached = WALL_SPRITE_CACHE.get(key)
+    if cached is None:
+        surf = pygame.Surface((width + 6, height + 6))
+        surf.fill(WALL_GLOW_COLOR)
+        pygame.draw.rect(surf, WALL_COLOR, (3, 3, width, height))
+        pygame.draw.rect(surf, (255, 255, 255), (3, 3, width, height), 2)
+        cached = WALL_SPRITE_CACHE[key] = surf.convert()
+    return cached
 
-# Pre-render common glow sizes
-GLOW_CACHE: Dict[Tuple[int, Tuple[int, int, int]], pygame.Surface] = {}
+# Max distinct HUD strings kept rendered by GitWarsEngine.render_text
+TEXT_CACHE_SIZE = 256
 
-def get_glow_surface(size: int, color: Tuple[int, int, int], alpha: int = 100) -> pygame.Surface:
-    """Get or create a cached glow surface."""
-    key = (size, color, alpha)
-    if key not in GLOW_CACHE:
-        GLOW_CACHE[key] = create_glow_surface(size, color, alpha)
-    return GLOW_CACHE[key]
+# Team-name labels drawn under tanks: one font, each name rendered once
+NAME_LABEL_FONT = pygame.font.Font(None, 20)
+NAME_LABEL_CACHE: Dict[str, Tuple[pygame.Surface, int, int]] = {}
+
+def get_name_label(name: str) -> Tuple[pygame.Surface, int, int]:
+    """Get or render a cached name label. Returns (label, half width, half height)."""
+    cached = NAME_LABEL_CACHE.get(name)
+    if cached is None:
+        label = NAME_LABEL_FONT.render(name, True, (200, 200, 200))
+        cached = NAME_LABEL_CACHE[name] = (label, label.get_width() // 2, label.get_height() // 2)
+    return cached
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -123,19 +187,24 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
 
 def distance(x1: float, y1: float, x2: float, y2: float) -> float:
     """Calculate distance between two points."""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return math.hypot(x2 - x1, y2 - y1)
+
+def distance_sq(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Squared distance between two points - compare against squared thresholds, no sqrt."""
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
 
 def angle_to(x1: float, y1: float, x2: float, y2: float) -> float:
     """Calculate angle from point 1 to point 2 in degrees."""
     return math.degrees(math.atan2(y2 - y1, x2 - x1))
 
 def normalize_angle(angle: float) -> float:
-    """Normalize angle to -180 to 180 range."""
-    while angle > 180:
-        angle -= 360
-    while angle < -180:
-        angle += 360
-    return angle
+    """Normalize angle to -180 to 180 range (constant time, any input magnitude)."""
+    return (angle + 180.0) % 360.0 - 180.0
+
+# Unit heading vector (cos, sin) per whole degree: index with round(angle) % 360
+UNIT_VECTOR_LUT = [(math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(360)]
 
 # Sensor constants
 SENSOR_MAX_RANGE = 300.0  # Max detection distance in pixels
@@ -145,57 +214,134 @@ SENSOR_ANGLES = {
     "right": 30      # 30 degrees to the right
 }
 
-def get_sensor_readings(tank_x: float, tank_y: float, tank_angle: float, walls: List) -> Dict[str, float]:
+# Ray end offsets per whole degree of tank heading: [(name, dx, dy) for each sensor]
+SENSOR_RAY_LUT = [
+    tuple((name, math.cos(math.radians(heading + offset)) * SENSOR_MAX_RANGE,
+           math.sin(math.radians(heading + offset)) * SENSOR_MAX_RANGE)
+          for name, offset in SENSOR_ANGLES.items())
+    for heading in range(360)
+]
+
+def get_sensor_readings(tank_x: float, tank_y: float, tank_angle: float, wall_rects: List[pygame.Rect]) -> Dict[str, float]:
     """
     Cast 3 rays (whiskers) from the tank to detect walls.
     Uses pygame.Rect.clipline for efficient collision detection.
+    wall_rects are the walls' rects, built once per level by the engine.
     
     Returns: {"front": dist, "left": dist, "right": dist}
     Max distance is SENSOR_MAX_RANGE (300). If no wall hit, returns 300.
     """
     readings = {}
     
-    for sensor_name, offset_angle in SENSOR_ANGLES.items():
-        # Calculate ray direction
-        ray_angle = math.radians(tank_angle + offset_angle)
-        
+    # Ray directions come from the per-degree table (heading rounded to the nearest degree)
+    for sensor_name, ray_dx, ray_dy in SENSOR_RAY_LUT[round(tank_angle) % 360]:
         # Ray start and end points
         start_x = tank_x
         start_y = tank_y
-        end_x = tank_x + math.cos(ray_angle) * SENSOR_MAX_RANGE
-        end_y = tank_y + math.sin(ray_angle) * SENSOR_MAX_RANGE
+        end_x = tank_x + ray_dx
+        end_y = tank_y + ray_dy
         
-        # Find shortest distance to any wall
-        min_dist = SENSOR_MAX_RANGE
+        # Find shortest distance to any wall (distance_sq inlined, one sqrt per ray at the end)
+        min_dist2 = SENSOR_MAX_RANGE * SENSOR_MAX_RANGE
         
-        for wall in walls:
-            wall_rect = wall.get_rect()
+        for wall_rect in wall_rects:
             # clipline returns the segment of line inside the rect, or empty tuple
-            clipped = wall_rect.clipline((start_x, start_y), (end_x, end_y))
+            clipped = wall_rect.clipline(start_x, start_y, end_x, end_y)
             
             if clipped:
                 # clipped is ((x1, y1), (x2, y2)) - the segment inside the wall
                 hit_x, hit_y = clipped[0]  # First intersection point
-                dist = distance(start_x, start_y, hit_x, hit_y)
-                if dist < min_dist:
-                    min_dist = dist
+                dx = hit_x - start_x
+                dy = hit_y - start_y
+                dist2 = dx * dx + dy * dy
+                if dist2 < min_dist2:
+                    min_dist2 = dist2
         
-        readings[sensor_name] = round(min_dist, 1)
+        readings[sensor_name] = round(math.sqrt(min_dist2), 1)
     
     return readings
 
+def build_wall_grid(wall_rects: List[pygame.Rect], margin: int,
+                    cell: int = GRID_CELL_SIZE) -> Dict[Tuple[int, int], List[pygame.Rect]]:
+    """
+    Bucket wall rects into a uniform grid: {(cell_x, cell_y): [rects]}.
+    Each wall is grown by `margin` before bucketing, so any object whose
+    center is in a cell and whose half-size is <= margin can only touch
+    the walls listed for that one cell.
+    """
+    grid: Dict[Tuple[int, int], List[pygame.Rect]] = {}
+    for rect in wall_rects:
+        for cell_x in range((rect.left - margin) // cell, (rect.right + margin) // cell + 1):
+            for cell_y in range((rect.top - margin) // cell, (rect.bottom + margin) // cell + 1):
+                grid.setdefault((cell_x, cell_y), []).append(rect)
+    return grid
+
+def resolve_tank_walls(x: float, y: float, wall_rects: List[pygame.Rect]) -> Tuple[float, float, bool, bool]:
+    """
+    Push a tank centered at (x, y) out of each wall it overlaps, in order,
+    along the axis of least overlap (so it slides along the wall).
+    One Rect is built per call and moved in place after each push.
+    Returns (x, y, hit_x, hit_y); hit_x/hit_y mean that velocity axis stops.
+    """
+    half = TANK_SIZE // 2
+    hit_x = hit_y = False
+    tank_rect = pygame.Rect(x - half, y - half, TANK_SIZE, TANK_SIZE)
+    for wall_rect in wall_rects:
+        if tank_rect.colliderect(wall_rect):
+            wall_left, wall_top, wall_width, wall_height = wall_rect
+            tank_left, tank_top = tank_rect.topleft
+            
+            # Calculate overlap on each axis
+            overlap_left = tank_left + TANK_SIZE - wall_left
+            overlap_right = wall_left + wall_width - tank_left
+            overlap_top = tank_top + TANK_SIZE - wall_top
+            overlap_bottom = wall_top + wall_height - tank_top
+            
+            # Smaller overlap per axis, and the push that clears it (no min() calls)
+            if overlap_left < overlap_right:
+                overlap_x = overlap_left
+                push_x = -(overlap_left + 1)
+            else:
+                overlap_x = overlap_right
+                push_x = overlap_right + 1
+            if overlap_top < overlap_bottom:
+                overlap_y = overlap_top
+                push_y = -(overlap_top + 1)
+            else:
+                overlap_y = overlap_bottom
+                push_y = overlap_bottom + 1
+            
+            # Resolve on the axis with smaller overlap (allows sliding!)
+            if overlap_x < overlap_y:
+                x += push_x
+                hit_x = True
+                tank_rect.x = int(x - half)  # Truncate as get_rect() does (setters round)
+            else:
+                y += push_y
+                hit_y = True
+                tank_rect.y = int(y - half)
+    return x, y, hit_x, hit_y
+
 # =============================================================================
 # CAMERA (Screen Shake)
 # =============================================================================
 
+# Pre-rolled shake offsets in [-1, 1], scaled by the current intensity each frame
+SHAKE_TABLE_SIZE = 256  # Power of two: the index wraps with a bit mask
+SHAKE_TABLE = [(random.uniform(-1, 1), random.uniform(-1, 1)) for _ in range(SHAKE_TABLE_SIZE)]
+
 class Camera:
     """Handles screen shake and camera effects."""
     
+    __slots__ = ("offset_x", "offset_y", "shake_intensity", "shake_timer", "shake_index", "version")
+    
     def __init__(self):
         self.offset_x = 0.0
         self.offset_y = 0.0
         self.shake_intensity = 0.0
         self.shake_timer = 0.0
+        self.shake_index = 0
+        self.version = 0  # Bumped whenever the offset changes: static entities cache apply() against it
     
     def shake(self, intensity: float = SHAKE_INTENSITY, duration: float = SHAKE_DURATION):
         """Trigger screen shake."""
@@ -206,64 +352,57 @@ class Camera:
         """Update camera shake."""
         if self.shake_timer > 0:
             self.shake_timer -= dt
-            self.offset_x = random.uniform(-self.shake_intensity, self.shake_intensity)
-            self.offset_y = random.uniform(-self.shake_intensity, self.shake_intensity)
+            self.shake_index = (self.shake_index + 1) & (SHAKE_TABLE_SIZE - 1)
+            unit_x, unit_y = SHAKE_TABLE[self.shake_index]
+            self.offset_x = unit_x * self.shake_intensity
+            self.offset_y = unit_y * self.shake_intensity
             self.shake_intensity *= SHAKE_DECAY
-        else:
+            self.version += 1
+        elif self.offset_x or self.offset_y:
             self.offset_x = 0
             self.offset_y = 0
             self.shake_intensity = 0
+            self.version += 1
+        else:
+            self.shake_intensity = 0
     
     def apply(self, pos: Tuple[float, float]) -> Tuple[int, int]:
         """Apply camera offset to a position."""
         return (int(pos[0] + self.offset_x), int(pos[1] + self.offset_y))
+    
+    def apply_many(self, points) -> List[Tuple[int, int]]:
+        """apply() for a whole sequence of points in one list comprehension."""
+        offset_x = self.offset_x
+        offset_y = self.offset_y
+        return [(int(x + offset_x), int(y + offset_y)) for x, y in points]
 
 # =============================================================================
 # PARTICLE SYSTEM (OPTIMIZED - Direct Drawing)
 # =============================================================================
 
-@dataclass
 class Particle:
-    """A single particle with physics and rendering."""
-    x: float
-    y: float
-    vx: float
-    vy: float
-    color: Tuple[int, int, int]
-    size: float
-    alpha: int = 255
-    alive: bool = True
+    """
+    A single particle. Pooled by ParticleSystem, which also runs its physics and
+    drawing; it is live while in ParticleSystem.particles, free while in _free.
+    """
     
-    def update(self):
-        """Update particle position and fade."""
-        self.x += self.vx
-        self.y += self.vy
-        self.vx *= PARTICLE_FRICTION
-        self.vy *= PARTICLE_FRICTION
-        self.alpha -= PARTICLE_FADE_SPEED
-        self.size *= 0.98
-        
-        if self.alpha <= 0 or self.size < 1:
-            self.alive = False
+    __slots__ = ("x", "y", "vx", "vy", "color", "size", "alpha")
+    
+    def __init__(self, x: float = 0.0, y: float = 0.0, vx: float = 0.0, vy: float = 0.0,
+                 color: Tuple[int, int, int] = (0, 0, 0), size: float = 0.0, alpha: int = 255):
+        self.reset(x, y, vx, vy, color, size, alpha)
+    
+    def reset(self, x: float, y: float, vx: float, vy: float,
+              color: Tuple[int, int, int], size: float, alpha: int = 255):
+        """Re-arm the particle in place (used when taking it from the free list)."""
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.color = color
+        self.size = size
+        self.alpha = alpha
     
-    def draw(self, surface: pygame.Surface, camera: Camera):
-        """Draw the particle - OPTIMIZED: direct drawing."""
-        if self.alpha <= 0 or self.size < 1:
-            return
-        
-        pos = camera.apply((self.x, self.y))
-        size = max(1, int(self.size))
-        
-        # OPTIMIZED: Draw directly instead of creating surfaces
-        # Use color brightness to simulate alpha fade
-        fade = self.alpha / 255.0
-        faded_color = (
-            int(self.color[0] * fade),
-            int(self.color[1] * fade),
-            int(self.color[2] * fade)
-        )
-        pygame.draw.rect(surface, faded_color, (pos[0] - size, pos[1] - size, size * 2, size * 2))
-
 
 class ParticleSystem:
     """Manages all particles in the game."""
@@ -271,113 +410,229 @@ class ParticleSystem:
     def __init__(self):
         self.particles: List[Particle] = []
         self.max_particles = 200  # Cap max particles
+        
+        # Free list: every particle is allocated once here and recycled, never garbage-collected
+        self._free: List[Particle] = [Particle() for _ in range(self.max_particles)]
+    
+    def clear(self):
+        """Remove all live particles, returning them to the free list."""
+        self._free.extend(self.particles)
+        self.particles.clear()
     
     def spawn_explosion(self, x: float, y: float, color: Tuple[int, int, int], count: int = PARTICLE_DEATH_COUNT):
         """Spawn an explosion of particles."""
         # Limit particles to prevent lag
-        count = min(count, self.max_particles - len(self.particles))
+        count = min(count, len(self._free))
+        
+        # random.random() is a single C call; uniform()/randint() each add Python frames.
+        # Same distributions: a + (b - a) * u, and randint(-30, 30) == int(u * 61) - 30
+        rand = random.random
+        cos = math.cos
+        sin = math.sin
+        speed_span = PARTICLE_DEATH_SPEED - 2
+        size_span = PARTICLE_SIZE_RANGE_HI - PARTICLE_SIZE_RANGE_LO
+        base_r, base_g, base_b = color
+        free = self._free
+        particles = self.particles
         
         for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, PARTICLE_DEATH_SPEED)
-            size = random.uniform(*PARTICLE_SIZE_RANGE)
+            angle = rand() * (2 * math.pi)
+            speed = 2 + speed_span * rand()
+            size = PARTICLE_SIZE_RANGE_LO + size_span * rand()
             
-            # Vary the color slightly
-            r = clamp(color[0] + random.randint(-30, 30), 0, 255)
-            g = clamp(color[1] + random.randint(-30, 30), 0, 255)
-            b = clamp(color[2] + random.randint(-30, 30), 0, 255)
+            # Vary the color slightly (clamp() inlined: no call per channel)
+            r = base_r + int(rand() * 61) - 30
+            g = base_g + int(rand() * 61) - 30
+            b = base_b + int(rand() * 61) - 30
+            r = 0 if r < 0 else (255 if r > 255 else r)
+            g = 0 if g < 0 else (255 if g > 255 else g)
+            b = 0 if b < 0 else (255 if b > 255 else b)
             
-            self.particles.append(Particle(
+            particle = free.pop()
+            particle.reset(
                 x=x,
                 y=y,
-                vx=math.cos(angle) * speed,
-                vy=math.sin(angle) * speed,
+                vx=cos(angle) * speed,
+                vy=sin(angle) * speed,
                 color=(int(r), int(g), int(b)),
                 size=size
-            ))
+            )
+            particles.append(particle)
     
     def spawn_muzzle_flash(self, x: float, y: float, angle: float, color: Tuple[int, int, int]):
-        """Spawn muzzle flash particles."""
+        """Spawn muzzle flash particles (angle in degrees)."""
+        self.spawn_muzzle_flash_rad(x, y, math.radians(angle), color)
+    
+    def spawn_muzzle_flash_rad(self, x: float, y: float, base_angle: float, color: Tuple[int, int, int]):
+        """spawn_muzzle_flash() for callers that already have the angle in radians."""
         # Limit particles
-        if len(self.particles) >= self.max_particles:
+        free = self._free
+        if not free:
             return
             
-        for _ in range(3):  # Reduced from 5
-            spread = random.uniform(-0.3, 0.3)
-            speed = random.uniform(3, 6)
+        rand = random.random
+        
+        for _ in range(min(3, len(free))):  # Reduced from 5
+            spread = 0.6 * rand() - 0.3
+            speed = 3 + 3 * rand()
             
-            self.particles.append(Particle(
+            particle = free.pop()
+            particle.reset(
                 x=x,
                 y=y,
-                vx=math.cos(math.radians(angle) + spread) * speed,
-                vy=math.sin(math.radians(angle) + spread) * speed,
+                vx=math.cos(base_angle + spread) * speed,
+                vy=math.sin(base_angle + spread) * speed,
                 color=color,
-                size=random.uniform(3, 6),
+                size=3 + 3 * rand(),
                 alpha=200
-            ))
+            )
+            self.particles.append(particle)
     
     def update(self):
-        """Update all particles."""
-        for particle in self.particles:
-            particle.update()
-        
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p.alive]
+        """Update all particles: position, friction and fade in one batched pass."""
+        particles = self.particles
+        free = self._free
+        friction = PARTICLE_FRICTION
+        fade = PARTICLE_FADE_SPEED
+        # Off-screen cull bounds, padded by the max screen-shake offset
+        min_edge = -SHAKE_INTENSITY
+        max_x = SCREEN_WIDTH + SHAKE_INTENSITY
+        max_y = SCREEN_HEIGHT + SHAKE_INTENSITY
+        
+        # Physics is inlined here (no per-particle method call); survivors are
+        # compacted to the front in place and dead particles go back to the free list
+        write = 0
+        for particle in particles:
+            x = particle.x + particle.vx
+            y = particle.y + particle.vy
+            particle.x = x
+            particle.y = y
+            particle.vx *= friction
+            particle.vy *= friction
+            alpha = particle.alpha - fade
+            size = particle.size * 0.98
+            particle.alpha = alpha
+            particle.size = size
+            
+            # Velocity only decays, never turns around: a particle that has left
+            # the screen (its whole square, shake included) never comes back
+            on_screen = (min_edge < x + size and x - size < max_x and
+                         min_edge < y + size and y - size < max_y)
+            
+            if alpha > 0 and size >= 1 and on_screen:
+                particles[write] = particle
+                write += 1
+            else:
+                free.append(particle)
+        del particles[write:]
     
     def draw(self, surface: pygame.Surface, camera: Camera):
-        """Draw all particles."""
+        """Draw all particles - OPTIMIZED: one batched loop, solid fills."""
+        fill = surface.fill
+        offset_x = camera.offset_x
+        offset_y = camera.offset_y
+        
         for particle in self.particles:
-            particle.draw(surface, camera)
+            alpha = particle.alpha
+            if alpha <= 0 or particle.size < 1:
+                continue
+            
+            size = max(1, int(particle.size))
+            x = int(particle.x + offset_x) - size
+            y = int(particle.y + offset_y) - size
+            
+            # Use color brightness to simulate alpha fade
+            fade = alpha / 255.0
+            r, g, b = particle.color
+            faded_color = (int(r * fade), int(g * fade), int(b * fade))
+            if x >= 0 and y >= 0:
+                fill(faded_color, (x, y, size * 2, size * 2))
+            else:
+                # fill() shifts rects with negative corners instead of clipping them
+                pygame.draw.rect(surface, faded_color, (x, y, size * 2, size * 2))
 
 # =============================================================================
-# BULLET TRAIL (OPTIMIZED - Single polyline instead of surfaces)
+# BULLET TRAIL (OPTIMIZED - Three plain polylines fading in thirds, no surfaces)
 # =============================================================================
 
 class Trail:
     """Fading trail effect for bullets - OPTIMIZED."""
     
+    __slots__ = ("max_length", "positions", "color", "fade_colors")
+    
+    # Brightness of the oldest and middle thirds of the trail (newest third is full color)
+    FADE_LEVELS = (0.3, 0.6)
+    
     def __init__(self, color: Tuple[int, int, int]):
-        self.positions: List[Tuple[float, float]] = []
-        self.color = color
         self.max_length = BULLET_TRAIL_LENGTH
+        # Ring buffer: appending past max_length drops the oldest point in O(1)
+        self.positions: Deque[Tuple[float, float]] = deque(maxlen=self.max_length)
+        self.set_color(color)
+    
+    def set_color(self, color: Tuple[int, int, int]):
+        """Set trail color and precompute its faded shades."""
+        self.color = color
+        self.fade_colors = [tuple(int(c * level) for c in color) for level in self.FADE_LEVELS]
+    
+    def reset(self, color: Tuple[int, int, int]):
+        """Empty the trail for reuse by a recycled bullet."""
+        self.positions.clear()
+        self.set_color(color)
     
     def add_point(self, x: float, y: float):
         """Add a new point to the trail."""
         self.positions.append((x, y))
-        if len(self.positions) > self.max_length:
-            self.positions.pop(0)
     
     def draw(self, surface: pygame.Surface, camera: Camera):
-        """Draw the fading trail - OPTIMIZED: single polyline."""
-        if len(self.positions) < 2:
+        """Draw the fading trail - OPTIMIZED: three plain polylines, dim to bright."""
+        count = len(self.positions)
+        if count < 2:
             return
         
         # OPTIMIZED: Draw as connected lines with direct pygame.draw
         # No surface creation!
-        points = [camera.apply(pos) for pos in self.positions]
+        points = camera.apply_many(self.positions)
         
-        # Draw trail as anti-aliased lines (hardware accelerated)
-        if len(points) >= 2:
-            pygame.draw.aalines(surface, self.color, False, points)
+        # Plain 2px lines: much cheaper than CPU-blended aalines, AA is invisible at bullet speed
+        if count < 4:
+            pygame.draw.lines(surface, self.color, False, points, 2)
+            return
+        
+        # Thirds share their end points so the trail stays connected
+        first = count // 3
+        second = 2 * count // 3
+        pygame.draw.lines(surface, self.fade_colors[0], False, points[:first + 1], 2)
+        pygame.draw.lines(surface, self.fade_colors[1], False, points[first:second + 1], 2)
+        pygame.draw.lines(surface, self.color, False, points[second:], 2)
 
 # =============================================================================
 # BULLET (OPTIMIZED)
 # =============================================================================
 
+# Bullet velocity per whole degree of aim, at BULLET_SPEED
+BULLET_VELOCITY_LUT = [(cos_a * BULLET_SPEED, sin_a * BULLET_SPEED) for cos_a, sin_a in UNIT_VECTOR_LUT]
+
 class Bullet:
     """Projectile with trail effect and critical hits."""
     
+    __slots__ = ("x", "y", "angle", "owner_id", "color", "vx", "vy",
+                 "is_critical", "damage", "trail", "sprite", "alive", "_rect")
+    
     def __init__(self, x: float, y: float, angle: float, owner_id: int, color: Tuple[int, int, int]):
+        self.trail = Trail(color)
+        self._rect = pygame.Rect(0, 0, BULLET_SIZE * 2, BULLET_SIZE * 2)  # Moved in place by get_rect()
+        self.reset(x, y, angle, owner_id, color)
+    
+    def reset(self, x: float, y: float, angle: float, owner_id: int, color: Tuple[int, int, int]):
+        """(Re)initialize the bullet in place so BulletPool can recycle it."""
         self.x = x
         self.y = y
         self.angle = angle
         self.owner_id = owner_id
         self.color = color
         
-        # Velocity
-        rad = math.radians(angle)
-        self.vx = math.cos(rad) * BULLET_SPEED
-        self.vy = math.sin(rad) * BULLET_SPEED
+        # Velocity (aim rounded to the nearest degree)
+        self.vx, self.vy = BULLET_VELOCITY_LUT[round(angle) % 360]
         
         # Critical hit check
         self.is_critical = random.random() < CRITICAL_HIT_CHANCE
@@ -388,45 +643,69 @@ class Bullet:
             self.damage = BULLET_DAMAGE
         
         # Trail
-        self.trail = Trail(self.color)
+        self.trail.reset(self.color)
+        self.sprite: Optional[Tuple[pygame.Surface, int]] = None
         self.alive = True
     
-    def update(self):
-        """Update bullet position."""
-        self.trail.add_point(self.x, self.y)
-        self.x += self.vx
-        self.y += self.vy
-        
-        # Check bounds
-        if self.x < 0 or self.x > SCREEN_WIDTH or self.y < 0 or self.y > SCREEN_HEIGHT:
-            self.alive = False
-    
     def draw(self, surface: pygame.Surface, camera: Camera):
         """Draw bullet and trail - OPTIMIZED."""
         # Draw trail first
         self.trail.draw(surface, camera)
         
-        # Draw bullet - OPTIMIZED: direct drawing
+        # Draw bullet - OPTIMIZED: one blit of the cached glow + core sprite
+        # (looked up on first draw, after a Juggernaut may have overridden is_critical)
+        if self.sprite is None:
+            self.sprite = get_bullet_sprite(self.color, self.is_critical)
+        sprite, half = self.sprite
         pos = camera.apply((self.x, self.y))
-        
-        # Glow effect - simple larger circle
-        glow_size = BULLET_SIZE * 2 if self.is_critical else BULLET_SIZE + 2
-        glow_color = tuple(max(0, c - 100) for c in self.color)  # Darker glow
-        pygame.draw.circle(surface, glow_color, pos, glow_size)
-        
-        # Core
-        pygame.draw.circle(surface, self.color, pos, BULLET_SIZE)
-        pygame.draw.circle(surface, (255, 255, 255), pos, BULLET_SIZE // 2)
+        surface.blit(sprite, (pos[0] - half, pos[1] - half))
     
     def get_rect(self) -> pygame.Rect:
-        """Get collision rectangle."""
-        return pygame.Rect(self.x - BULLET_SIZE, self.y - BULLET_SIZE, 
-                          BULLET_SIZE * 2, BULLET_SIZE * 2)
+        """Get collision rectangle (one Rect per bullet, moved to the current position)."""
+        rect = self._rect
+        # int(): Rect setters round, the Rect constructor truncates
+        rect.x = int(self.x - BULLET_SIZE)
+        rect.y = int(self.y - BULLET_SIZE)
+        return rect
+
+class BulletPool:
+    """Free list of dead bullets, recycled instead of reallocated on every shot."""
+    
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self._free: List[Bullet] = []
+    
+    def acquire(self, x: float, y: float, angle: float, owner_id: int, color: Tuple[int, int, int]) -> Bullet:
+        """Get a freshly reset bullet, reusing a dead one when available."""
+        if self._free:
+            bullet = self._free.pop()
+            bullet.reset(x, y, angle, owner_id, color)
+            return bullet
+        return Bullet(x, y, angle, owner_id, color)
+    
+    def release(self, bullet: Bullet):
+        """Return a dead bullet to the pool."""
+        if len(self._free) < self.capacity:
+            self._free.append(bullet)
+
+BULLET_POOL = BulletPool()
 
 # =============================================================================
 # TANK (OPTIMIZED - Pre-rendered surfaces)
 # =============================================================================
 
+def roll_moves_until_jam() -> float:
+    """
+    Number of moves before a tank's next random jam: geometric with p = JAM_CHANCE,
+    so a countdown gives the same per-move odds as one random() per move,
+    with one draw per jam instead.
+    """
+    if JAM_CHANCE <= 0:
+        return math.inf
+    if JAM_CHANCE >= 1:
+        return 0
+    return int(math.log(1.0 - random.random()) / math.log(1.0 - JAM_CHANCE))
+
 class Tank:
     """Player/Bot controlled tank with Euler physics."""
     
@@ -447,39 +726,44 @@ class Tank:
         # =====================================================================
         # EULER PHYSICS SYSTEM
         # =====================================================================
+        # Plain floats, not Vector2: every Vector2 op allocates. Position is x/y.
         self.mass = TANK_MASS
-        self.pos = pygame.math.Vector2(x, y)
-        self.velocity = pygame.math.Vector2(0, 0)
-        self.acceleration = pygame.math.Vector2(0, 0)
+        self.vx = 0.0
+        self.vy = 0.0
+        self.ax = 0.0
+        self.ay = 0.0
         self.friction = TANK_FRICTION
         
         # State
         self.is_jammed = False
         self.jam_timer = 0.0
+        self.moves_until_jam = roll_moves_until_jam()
         self.shoot_cooldown = 0.0
         self.last_action = None
         
         # Visual state
         self.muzzle_flash_timer = 0
         
-        # OPTIMIZATION: Pre-render tank body surface
-        self._base_surface = pygame.Surface((TANK_SIZE, TANK_SIZE), pygame.SRCALPHA)
-        pygame.draw.rect(self._base_surface, self.color, (2, 2, TANK_SIZE - 4, TANK_SIZE - 4), border_radius=5)
-        pygame.draw.rect(self._base_surface, (255, 255, 255), (2, 2, TANK_SIZE - 4, TANK_SIZE - 4), 2, border_radius=5)
-        
-        # Cache rotated surfaces
-        self._last_angle = None
-        self._rotated_surface = None
+        # Collision rect, moved in place by get_rect()
+        self._rect = pygame.Rect(0, 0, TANK_SIZE, TANK_SIZE)
     
-    def apply_force(self, force_vector: pygame.math.Vector2):
+    def apply_force(self, fx: float, fy: float):
         """
         Apply a force to the tank. F = ma -> a = F / m
         Multiple forces in one frame will accumulate naturally.
         """
-        self.acceleration += force_vector / self.mass
+        self.ax += fx / self.mass
+        self.ay += fy / self.mass
     
-    def update(self, dt: float, walls: List['Wall'] = None):
-        """Update tank state with Force Accumulation physics."""
+    def update(self, dt: float, walls: List['Wall'] = None,
+               wall_grid: Dict[Tuple[int, int], List[pygame.Rect]] = None):
+        """
+        Update tank state with Force Accumulation physics.
+        wall_grid (from build_wall_grid) narrows the wall checks to the
+        tank's own cell; without it every wall in `walls` is tested.
+        """
+        # One fused pass: tank state is read into locals once and written back once
+        
         # Handle jam timer (but do NOT block physics!)
         if self.jam_timer > 0:
             self.jam_timer -= dt
@@ -489,67 +773,50 @@ class Tank:
         # FORCE ACCUMULATION PHYSICS (User's exact pattern)
         # =====================================================================
         
+        vx = self.vx
+        vy = self.vy
+        ax = self.ax
+        ay = self.ay
+        
         # 1. APPLY FRICTION (Force opposing velocity)
         # This naturally slows down BOTH movement and knockback smoothly.
-        if self.velocity.length() > 0.5:
-            friction_force = self.velocity.normalize() * (-self.friction) * self.velocity.length()
-            self.acceleration += friction_force
+        # normalize() * -friction * length() is just -friction * velocity.
+        if vx * vx + vy * vy > 0.25:  # speed > 0.5
+            friction = self.friction
+            ax -= friction * vx
+            ay -= friction * vy
         
         # 2. INTEGRATE PHYSICS (Euler Integration)
         # Velocity changes by Acceleration over Time
-        self.velocity += self.acceleration * dt
-        # Position changes by Velocity over Time
-        self.pos += self.velocity * dt
+        vx += ax * dt
+        vy += ay * dt
         
         # 3. RESET ACCELERATION (At END of frame, ready for next)
-        self.acceleration = pygame.math.Vector2(0, 0)
+        self.ax = 0.0
+        self.ay = 0.0
         
-        # 4. Sync x/y for compatibility
-        self.x = self.pos.x
-        self.y = self.pos.y
-        
-        # Clamp to screen bounds
-        self.x = clamp(self.x, TANK_SIZE, SCREEN_WIDTH - TANK_SIZE)
-        self.y = clamp(self.y, TANK_SIZE, SCREEN_HEIGHT - TANK_SIZE)
-        self.pos.x = self.x
-        self.pos.y = self.y
+        # Position changes by Velocity over Time, clamped to screen bounds
+        x = max(TANK_SIZE, min(SCREEN_WIDTH - TANK_SIZE, self.x + vx * dt))
+        y = max(TANK_SIZE, min(SCREEN_HEIGHT - TANK_SIZE, self.y + vy * dt))
         
         # Wall collision (SLIDING - not sticky!)
-        if walls:
-            tank_rect = self.get_rect()
-            for wall in walls:
-                wall_rect = wall.get_rect()
-                if tank_rect.colliderect(wall_rect):
-                    # Calculate overlap on each axis
-                    overlap_left = tank_rect.right - wall_rect.left
-                    overlap_right = wall_rect.right - tank_rect.left
-                    overlap_top = tank_rect.bottom - wall_rect.top
-                    overlap_bottom = wall_rect.bottom - tank_rect.top
-                    
-                    # Find minimum overlap (the axis we need to resolve)
-                    min_overlap_x = min(overlap_left, overlap_right)
-                    min_overlap_y = min(overlap_top, overlap_bottom)
-                    
-                    # Resolve collision on the axis with smaller overlap (allows sliding!)
-                    if min_overlap_x < min_overlap_y:
-                        # Horizontal collision - push out horizontally, KEEP vertical velocity
-                        if overlap_left < overlap_right:
-                            self.pos.x -= overlap_left + 1
-                        else:
-                            self.pos.x += overlap_right + 1
-                        self.velocity.x = 0  # Stop horizontal, but slide vertically
-                    else:
-                        # Vertical collision - push out vertically, KEEP horizontal velocity
-                        if overlap_top < overlap_bottom:
-                            self.pos.y -= overlap_top + 1
-                        else:
-                            self.pos.y += overlap_bottom + 1
-                        self.velocity.y = 0  # Stop vertical, but slide horizontally
-                    
-                    # Sync position
-                    self.x = self.pos.x
-                    self.y = self.pos.y
-                    tank_rect = self.get_rect()  # Update rect for next wall check
+        if wall_grid is not None:
+            wall_rects = wall_grid.get((int(x) // GRID_CELL_SIZE, int(y) // GRID_CELL_SIZE), ())
+        elif walls:
+            wall_rects = [wall.get_rect() for wall in walls]
+        else:
+            wall_rects = ()
+        if wall_rects:
+            x, y, hit_x, hit_y = resolve_tank_walls(x, y, wall_rects)
+            if hit_x:
+                vx = 0.0  # Stop horizontal, but slide vertically
+            if hit_y:
+                vy = 0.0  # Stop vertical, but slide horizontally
+        
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
         
         # Update cooldowns
         if self.shoot_cooldown > 0:
@@ -563,21 +830,19 @@ class Tank:
         if self.is_jammed:
             return
         
-        # Random jam check
-        if random.random() < JAM_CHANCE:
+        # Random jam check (JAM_CHANCE per move, via a pre-rolled countdown)
+        if self.moves_until_jam <= 0:
             self.is_jammed = True
             self.jam_timer = 1.0
+            self.moves_until_jam = roll_moves_until_jam()
             return
+        self.moves_until_jam -= 1
         
         # Normalize and ADD as force (NEVER overwrite velocity!)
         length = math.sqrt(dx * dx + dy * dy)
         if length > 0:
-            input_force = pygame.math.Vector2(
-                (dx / length) * TANK_ENGINE_FORCE,
-                (dy / length) * TANK_ENGINE_FORCE
-            )
             # ADD to acceleration, don't replace
-            self.acceleration += input_force / self.mass
+            self.apply_force((dx / length) * TANK_ENGINE_FORCE, (dy / length) * TANK_ENGINE_FORCE)
             self.angle = math.degrees(math.atan2(dy, dx))
     
     def shoot(self, target_angle: float) -> Optional[Bullet]:
@@ -589,19 +854,17 @@ class Tank:
         self.shoot_cooldown = 0.2
         self.muzzle_flash_timer = MUZZLE_FLASH_DURATION
         
+        # Same whole-degree direction the bullet flies along
+        cos_a, sin_a = UNIT_VECTOR_LUT[round(target_angle) % 360]
+        
         # Recoil as force
-        rad = math.radians(target_angle)
-        recoil_force = pygame.math.Vector2(
-            -math.cos(rad) * TANK_RECOIL * 2,
-            -math.sin(rad) * TANK_RECOIL * 2
-        )
-        self.apply_force(recoil_force)
+        self.apply_force(-cos_a * TANK_RECOIL * 2, -sin_a * TANK_RECOIL * 2)
         
         # Create bullet at barrel tip
-        barrel_x = self.x + math.cos(rad) * (TANK_SIZE / 2 + 5)
-        barrel_y = self.y + math.sin(rad) * (TANK_SIZE / 2 + 5)
+        barrel_x = self.x + cos_a * (TANK_SIZE / 2 + 5)
+        barrel_y = self.y + sin_a * (TANK_SIZE / 2 + 5)
         
-        return Bullet(barrel_x, barrel_y, target_angle, self.id, self.color)
+        return BULLET_POOL.acquire(barrel_x, barrel_y, target_angle, self.id, self.color)
     
     def take_damage(self, damage: float):
         """Apply damage to the tank."""
@@ -612,14 +875,11 @@ class Tank:
     
     def apply_knockback(self, angle: float, force: float):
         """Apply knockback as IMPULSE (direct velocity change, not acceleration)."""
-        rad = math.radians(angle)
+        cos_a, sin_a = UNIT_VECTOR_LUT[round(angle) % 360]
         # Impulse: directly add to velocity (not acceleration)
         # This gives INSTANT kick that friction will smooth out
-        impulse = pygame.math.Vector2(
-            math.cos(rad) * force * 15.0,  # Scale for impact
-            math.sin(rad) * force * 15.0
-        )
-        self.velocity += impulse  # IMPULSE: Add directly to velocity!
+        self.vx += cos_a * force * 15.0  # IMPULSE: Add directly to velocity!
+        self.vy += sin_a * force * 15.0  # (15.0: scale for impact)
     
     def draw(self, surface: pygame.Surface, camera: Camera, particles: ParticleSystem):
         """Draw the tank - OPTIMIZED."""
@@ -632,18 +892,14 @@ class Tank:
         glow_color = tuple(max(0, c - 180) for c in self.color)
         pygame.draw.circle(surface, glow_color, pos, TANK_SIZE)
         
-        # OPTIMIZED: Cache rotated surface
-        rounded_angle = round(self.angle / 5) * 5  # Round to 5 degrees
-        if self._last_angle != rounded_angle:
-            self._rotated_surface = pygame.transform.rotate(self._base_surface, -rounded_angle)
-            self._last_angle = rounded_angle
-        
-        rect = self._rotated_surface.get_rect(center=pos)
-        surface.blit(self._rotated_surface, rect)
+        # OPTIMIZED: Pre-rotated body, angle rounded to TANK_SPRITE_STEP degrees
+        body, half_w, half_h = get_tank_sprites(self.color)[round(self.angle / TANK_SPRITE_STEP) % TANK_SPRITE_COUNT]
+        surface.blit(body, (pos[0] - half_w, pos[1] - half_h))
         
-        # Barrel
-        barrel_end_x = pos[0] + math.cos(math.radians(self.angle)) * (TANK_SIZE / 2 + 10)
-        barrel_end_y = pos[1] + math.sin(math.radians(self.angle)) * (TANK_SIZE / 2 + 10)
+        # Barrel (one table lookup shared by the barrel and the muzzle flash)
+        cos_a, sin_a = UNIT_VECTOR_LUT[round(self.angle) % 360]
+        barrel_end_x = pos[0] + cos_a * (TANK_SIZE / 2 + 10)
+        barrel_end_y = pos[1] + sin_a * (TANK_SIZE / 2 + 10)
         pygame.draw.line(surface, self.color, pos, (int(barrel_end_x), int(barrel_end_y)), 6)
         pygame.draw.line(surface, (255, 255, 255), pos, (int(barrel_end_x), int(barrel_end_y)), 2)
         
@@ -670,15 +926,16 @@ class Tank:
         
         # Team name label below tank
         if hasattr(self, 'team_name') and self.team_name:
-            font = pygame.font.Font(None, 20)
-            name_surface = font.render(self.team_name, True, (200, 200, 200))
-            name_rect = name_surface.get_rect(center=(pos[0], pos[1] + TANK_SIZE // 2 + 18))
-            surface.blit(name_surface, name_rect)
+            label, half_w, half_h = get_name_label(self.team_name)
+            surface.blit(label, (pos[0] - half_w, pos[1] + TANK_SIZE // 2 + 18 - half_h))
     
     def get_rect(self) -> pygame.Rect:
-        """Get collision rectangle."""
-        return pygame.Rect(self.x - TANK_SIZE // 2, self.y - TANK_SIZE // 2, 
-                          TANK_SIZE, TANK_SIZE)
+        """Get collision rectangle (the tank's own Rect, moved in place: don't keep it)."""
+        rect = self._rect
+        # int(): Rect setters round, the Rect constructor truncates
+        rect.x = int(self.x - TANK_SIZE // 2)
+        rect.y = int(self.y - TANK_SIZE // 2)
+        return rect
     
     def get_context(self) -> Dict:
         """Get context data for bot (read-only copy)."""
@@ -695,6 +952,11 @@ class Tank:
 # COIN (OPTIMIZED)
 # =============================================================================
 
+# Coin glow radius per 1/COIN_PULSE_STEPS of a pulse_phase turn: int(COIN_SIZE // 2 + abs(sin) * 5)
+COIN_PULSE_STEPS = 256  # Power of two: the index wraps with a bit mask
+COIN_PULSE_SCALE = COIN_PULSE_STEPS / (2 * math.pi)
+COIN_GLOW_LUT = [int(COIN_SIZE // 2 + abs(math.sin(i / COIN_PULSE_SCALE)) * 5) for i in range(COIN_PULSE_STEPS)]
+
 class Coin:
     """Collectible coin for The Scramble mode."""
     
@@ -703,6 +965,7 @@ class Coin:
         self.y = y
         self.collected = False
         self.pulse_phase = random.uniform(0, 2 * math.pi)
+        self._rect = pygame.Rect(x - COIN_SIZE // 2, y - COIN_SIZE // 2, COIN_SIZE, COIN_SIZE)
     
     def update(self, dt: float):
         """Update coin animation."""
@@ -715,9 +978,8 @@ class Coin:
         
         pos = camera.apply((self.x, self.y))
         
-        # Pulsing glow - simple circles
-        pulse = abs(math.sin(self.pulse_phase))
-        glow_size = int(COIN_SIZE // 2 + pulse * 5)
+        # Pulsing glow - simple circles, radius from the per-phase table
+        glow_size = COIN_GLOW_LUT[int(self.pulse_phase * COIN_PULSE_SCALE) & (COIN_PULSE_STEPS - 1)]
         
         # Outer glow (darker gold)
         pygame.draw.circle(surface, (180, 150, 0), pos, glow_size)
@@ -727,9 +989,8 @@ class Coin:
         pygame.draw.circle(surface, (255, 255, 200), pos, COIN_SIZE // 4)
     
     def get_rect(self) -> pygame.Rect:
-        """Get collision rectangle."""
-        return pygame.Rect(self.x - COIN_SIZE // 2, self.y - COIN_SIZE // 2, 
-                          COIN_SIZE, COIN_SIZE)
+        """Get collision rectangle (built once: coins don't move)."""
+        return self._rect
 
 # =============================================================================
 # WALL (OPTIMIZED)
@@ -743,19 +1004,24 @@ class Wall:
         self.y = y
         self.width = width
         self.height = height
+        self._rect = pygame.Rect(x, y, width, height)
+        
+        # Sprite screen position, recomputed only when the camera offset changes
+        self._cam_version = -1
+        self._screen_pos = (0, 0)
     
     def draw(self, surface: pygame.Surface, camera: Camera):
-        """Draw wall - OPTIMIZED: direct drawing."""
-        pos = camera.apply((self.x, self.y))
+        """Draw wall - OPTIMIZED: one opaque blit of the pre-rendered sprite."""
+        if self._cam_version != camera.version:
+            pos = camera.apply((self.x, self.y))
+            self._screen_pos = (pos[0] - 3, pos[1] - 3)  # Sprite corner, glow included
+            self._cam_version = camera.version
         
-        # Wall (no glow surface - direct draw)
-        pygame.draw.rect(surface, WALL_GLOW_COLOR, (pos[0] - 3, pos[1] - 3, self.width + 6, self.height + 6))
-        pygame.draw.rect(surface, WALL_COLOR, (pos[0], pos[1], self.width, self.height))
-        pygame.draw.rect(surface, (255, 255, 255), (pos[0], pos[1], self.width, self.height), 2)
+        surface.blit(get_wall_sprite(self.width, self.height), self._screen_pos)
     
     def get_rect(self) -> pygame.Rect:
-        """Get collision rectangle."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """Get collision rectangle (built once: walls never move)."""
+        return self._rect
     
     def get_context(self) -> Dict:
         """Get context data for bot."""
@@ -797,6 +1063,14 @@ class Zone:
         return (x < self.margin or x > SCREEN_WIDTH - self.margin or
                 y < self.margin or y > SCREEN_HEIGHT - self.margin)
     
+    def tanks_in_danger(self, tanks: List['Tank']) -> List['Tank']:
+        """is_in_danger() for every tank in one pass (pass alive tanks only), bounds computed once."""
+        margin = self.margin
+        max_x = SCREEN_WIDTH - margin
+        max_y = SCREEN_HEIGHT - margin
+        return [tank for tank in tanks
+                if tank.x < margin or tank.x > max_x or tank.y < margin or tank.y > max_y]
+    
     def draw(self, surface: pygame.Surface, camera: Camera):
         """Draw the danger zone - OPTIMIZED."""
         if self.margin <= 0:
@@ -824,6 +1098,16 @@ class Zone:
 class Laser:
     """Sudden death laser for The Duel mode."""
     
+    # Beam bands as (left offset from the beam x, width, color), back to front.
+    # Each covers the same columns as a draw.line of that width would.
+    BANDS = (
+        (-13, 8, (100, 0, 0)),
+        (-4, 4, (200, 0, 0)),
+        (0, 2, (255, 255, 255)),
+        (2, 4, (200, 0, 0)),
+        (7, 8, (100, 0, 0)),
+    )
+    
     def __init__(self):
         self.active = False
         self.x = 0
@@ -860,17 +1144,66 @@ class Laser:
         
         laser_x = int(self.x)
         
-        # OPTIMIZED: Simple lines instead of surfaces
-        pygame.draw.line(surface, (100, 0, 0), (laser_x - 10, 0), (laser_x - 10, SCREEN_HEIGHT), 8)
-        pygame.draw.line(surface, (200, 0, 0), (laser_x - 3, 0), (laser_x - 3, SCREEN_HEIGHT), 4)
-        pygame.draw.line(surface, (255, 255, 255), (laser_x, 0), (laser_x, SCREEN_HEIGHT), 2)
-        pygame.draw.line(surface, (200, 0, 0), (laser_x + 3, 0), (laser_x + 3, SCREEN_HEIGHT), 4)
-        pygame.draw.line(surface, (100, 0, 0), (laser_x + 10, 0), (laser_x + 10, SCREEN_HEIGHT), 8)
+        # OPTIMIZED: Solid full-height fills instead of thick lines
+        for left, width, color in self.BANDS:
+            left += laser_x
+            if left < 0:  # fill() shifts a rect with a negative corner instead of clipping it
+                width += left
+                left = 0
+            if width > 0:
+                surface.fill(color, (left, 0, width, SCREEN_HEIGHT))
 
 # =============================================================================
 # DANGER ZONE (Orbital Strike - Mode 2)
 # =============================================================================
 
+# Pulse/flash levels pre-rendered per danger zone phase (shared by all zones)
+DANGER_ZONE_FRAME_COUNT = 16
+DANGER_ZONE_FRAME_CACHE: Dict[Tuple[int, int], pygame.Surface] = {}
+
+def premultiply(color: Tuple[int, int, int], alpha: int) -> Tuple[int, int, int]:
+    """Scale an RGB color by alpha/255, for drawing onto an additive (BLEND_RGB_ADD) sprite."""
+    return tuple(c * alpha // 255 for c in color)
+
+def get_danger_zone_frame(phase: int, level: int) -> pygame.Surface:
+    """
+    Get or render a cached danger zone frame. level in [0, DANGER_ZONE_FRAME_COUNT)
+    is the pulse (warning) or flash (active) amount, quantized from 0..1.
+    Frames are opaque, black where empty, with colors premultiplied by the
+    old per-pixel alpha: blit them with BLEND_RGB_ADD.
+    """
+    key = (phase, level)
+    cached = DANGER_ZONE_FRAME_CACHE.get(key)
+    if cached is None:
+        radius = DANGER_ZONE_RADIUS
+        center = (radius + 10, radius + 10)
+        frame = pygame.Surface((radius * 2 + 20, radius * 2 + 20))
+        frame.fill((0, 0, 0))
+        amount = level / (DANGER_ZONE_FRAME_COUNT - 1)  # 0 to 1
+        
+        if phase == DangerZone.PHASE_WARNING:
+            # Pulsing warning circle
+            alpha = int(50 + amount * 100)  # 50 to 150
+            pygame.draw.circle(frame, premultiply((255, 50, 50), alpha), center, radius)
+            pygame.draw.circle(frame, premultiply((255, 100, 100), alpha + 50), center, radius, 4)
+            
+            # Draw "X" crosshair
+            cross_color = premultiply((255, 0, 0), int(100 + amount * 100))
+            pygame.draw.line(frame, cross_color,
+                           (center[0] - radius, center[1]),
+                           (center[0] + radius, center[1]), 2)
+            pygame.draw.line(frame, cross_color,
+                           (center[0], center[1] - radius),
+                           (center[0], center[1] + radius), 2)
+        else:
+            # Flashing active zone
+            alpha = int(100 + amount * 80)
+            pygame.draw.circle(frame, premultiply((255, 150 + int(amount * 100), 150), alpha), center, radius)
+            pygame.draw.circle(frame, premultiply((255, 255, 255), alpha), center, radius, 3)
+        
+        cached = DANGER_ZONE_FRAME_CACHE[key] = frame.convert()
+    return cached
+
 class DangerZone:
     """
     Orbital Strike danger zone for Labyrinth mode.
@@ -893,13 +1226,9 @@ class DangerZone:
         self.timer = 0.0
         self.blast_timer = 0.0
         
-        # Visual
+        # Visual (frames come from the shared DANGER_ZONE_FRAME_CACHE)
         self.pulse_time = 0.0
         
-        # Pre-render warning circle surface (with alpha)
-        self.warning_surface = pygame.Surface((self.radius * 2 + 20, self.radius * 2 + 20), pygame.SRCALPHA)
-        self.active_surface = pygame.Surface((self.radius * 2 + 20, self.radius * 2 + 20), pygame.SRCALPHA)
-        
         # Play siren sound on spawn
         play_sound(SFX_COIN)  # Use coin sound as placeholder for siren
     
@@ -930,10 +1259,10 @@ class DangerZone:
     def _spawn_blast(self):
         """Spawn explosion particles at random point inside zone."""
         # Random point inside circle
-        angle = random.uniform(0, math.pi * 2)
+        cos_a, sin_a = UNIT_VECTOR_LUT[int(random.random() * 360)]
         dist = random.uniform(0, self.radius * 0.8)
-        blast_x = self.x + math.cos(angle) * dist
-        blast_y = self.y + math.sin(angle) * dist
+        blast_x = self.x + cos_a * dist
+        blast_y = self.y + sin_a * dist
         
         # Spawn particles
         self.particles.spawn_explosion(blast_x, blast_y, (255, 100, 50))
@@ -944,14 +1273,31 @@ class DangerZone:
         if self.phase != self.PHASE_ACTIVE:
             return False
         
-        dist = distance(self.x, self.y, tank.x, tank.y)
-        return dist < self.radius
+        dx = tank.x - self.x
+        dy = tank.y - self.y
+        return dx * dx + dy * dy < DANGER_ZONE_RADIUS_SQ
+    
+    def tanks_hit(self, tanks) -> List:
+        """check_hit() for every tank in one pass (pass alive tanks only; empty unless active)."""
+        if self.phase != self.PHASE_ACTIVE:
+            return []
+        zone_x = self.x
+        zone_y = self.y
+        hit = []
+        for tank in tanks:
+            dx = tank.x - zone_x
+            dy = tank.y - zone_y
+            if dx * dx + dy * dy < DANGER_ZONE_RADIUS_SQ:
+                hit.append(tank)
+        return hit
     
     def apply_damage(self, tank):
         """Apply damage and knockback to tank in zone."""
-        if not self.check_hit(tank):
-            return
-        
+        if self.check_hit(tank):
+            self.apply_hit(tank)
+    
+    def apply_hit(self, tank):
+        """Apply damage and knockback to a tank already known to be in the zone."""
         # Damage
         tank.take_damage(DANGER_ZONE_DAMAGE)
         
@@ -960,47 +1306,99 @@ class DangerZone:
         tank.apply_knockback(angle, DANGER_ZONE_KNOCKBACK)
     
     def draw(self, surface: pygame.Surface, camera: Camera):
-        """Draw the danger zone with visual effects."""
+        """Draw the danger zone with visual effects (one additive blit of a pre-rendered frame)."""
         pos = camera.apply((self.x, self.y))
-        center = (self.radius + 10, self.radius + 10)
         
         if self.phase == self.PHASE_WARNING:
             # Pulsing warning circle
             pulse = (math.sin(self.pulse_time) + 1) / 2  # 0 to 1
-            alpha = int(50 + pulse * 100)  # 50 to 150
-            
-            self.warning_surface.fill((0, 0, 0, 0))
-            pygame.draw.circle(self.warning_surface, (255, 50, 50, alpha), center, self.radius)
-            pygame.draw.circle(self.warning_surface, (255, 100, 100, alpha + 50), center, self.radius, 4)
-            
-            # Draw "X" crosshair
-            cross_alpha = int(100 + pulse * 100)
-            pygame.draw.line(self.warning_surface, (255, 0, 0, cross_alpha), 
-                           (center[0] - self.radius, center[1]), 
-                           (center[0] + self.radius, center[1]), 2)
-            pygame.draw.line(self.warning_surface, (255, 0, 0, cross_alpha), 
-                           (center[0], center[1] - self.radius), 
-                           (center[0], center[1] + self.radius), 2)
-            
-            blit_pos = (pos[0] - self.radius - 10, pos[1] - self.radius - 10)
-            surface.blit(self.warning_surface, blit_pos)
-        
         elif self.phase == self.PHASE_ACTIVE:
             # Flashing active zone
-            flash = (math.sin(self.pulse_time * 3) + 1) / 2
-            alpha = int(100 + flash * 80)
-            
-            self.active_surface.fill((0, 0, 0, 0))
-            pygame.draw.circle(self.active_surface, (255, 150 + int(flash * 100), 150, alpha), center, self.radius)
-            pygame.draw.circle(self.active_surface, (255, 255, 255, alpha), center, self.radius, 3)
-            
-            blit_pos = (pos[0] - self.radius - 10, pos[1] - self.radius - 10)
-            surface.blit(self.active_surface, blit_pos)
+            pulse = (math.sin(self.pulse_time * 3) + 1) / 2
+        else:
+            return
+        
+        frame = get_danger_zone_frame(self.phase, round(pulse * (DANGER_ZONE_FRAME_COUNT - 1)))
+        surface.blit(frame, (pos[0] - self.radius - 10, pos[1] - self.radius - 10),
+                     special_flags=pygame.BLEND_RGB_ADD)
 
 # =============================================================================
 # JUGGERNAUT (Boss - Mode 3)
 # =============================================================================
 
+def saw_tooth(angle: float, radius: int) -> Tuple[Tuple[float, float], ...]:
+    """One saw-blade tooth triangle (outer point, two inner points) as offsets from the blade center."""
+    return (
+        (math.cos(angle) * (radius + 15), math.sin(angle) * (radius + 15)),
+        (math.cos(angle - 0.2) * (radius - 5), math.sin(angle - 0.2) * (radius - 5)),
+        (math.cos(angle + 0.2) * (radius - 5), math.sin(angle + 0.2) * (radius - 5)),
+    )
+
+# Saw-blade teeth (8 triangular notches), computed once at import
+JUGGERNAUT_TEETH = [saw_tooth(i * (math.pi / 4), JUGGERNAUT_SIZE // 2) for i in range(8)]
+
+# Charge-phase turret color per 1/256 of a sine turn: flash = abs(sin(weapon_timer * 10))
+JUGGERNAUT_FLASH_STEPS = 256  # Power of two: the index wraps with a bit mask
+JUGGERNAUT_FLASH_SCALE = 10 * JUGGERNAUT_FLASH_STEPS / (2 * math.pi)  # weapon_timer -> index
+JUGGERNAUT_CHARGE_COLORS = tuple(
+    (255, int(100 + flash * 155), int(flash * 100))
+    for flash in (abs(math.sin(2 * math.pi * i / JUGGERNAUT_FLASH_STEPS)) for i in range(JUGGERNAUT_FLASH_STEPS))
+)
+
+# The blade looks the same every 45 degrees (8 teeth), so whole-degree
+# rotations over one 45 degree period cover every angle
+JUGGERNAUT_BODY_SYMMETRY = 45
+
+JUGGERNAUT_ATLAS_COLUMNS = 9  # 9 x 5 cells keeps the atlas well under texture size limits
+
+# Saw-blade body shared by every Juggernaut: rendered once, plus one atlas of its rotations
+JUGGERNAUT_BODY_CACHE: List[pygame.Surface] = []
+JUGGERNAUT_ATLAS_CACHE: List[Tuple[pygame.Surface, List[Tuple[pygame.Rect, int, int]]]] = []
+
+def get_juggernaut_body() -> pygame.Surface:
+    """Get or render the cached (unrotated) saw-blade body surface."""
+    if not JUGGERNAUT_BODY_CACHE:
+        size = JUGGERNAUT_SIZE + 20
+        radius = JUGGERNAUT_SIZE // 2
+        body = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = size // 2
+        
+        # Outer glow
+        pygame.draw.circle(body, (*JUGGERNAUT_COLOR, 80), (center, center), radius + 10)
+        
+        # Main body
+        pygame.draw.circle(body, JUGGERNAUT_COLOR, (center, center), radius)
+        
+        # Saw-blade teeth (8 triangular notches, precomputed: no trig here)
+        for tooth in JUGGERNAUT_TEETH:
+            pygame.draw.polygon(body, JUGGERNAUT_BLADE_COLOR,
+                                [(center + dx, center + dy) for dx, dy in tooth])
+        
+        # Inner ring
+        pygame.draw.circle(body, (100, 30, 30), (center, center), radius // 2)
+        pygame.draw.circle(body, (60, 15, 15), (center, center), radius // 3)
+        JUGGERNAUT_BODY_CACHE.append(body)
+    return JUGGERNAUT_BODY_CACHE[0]
+
+def get_juggernaut_atlas() -> Tuple[pygame.Surface, List[Tuple[pygame.Rect, int, int]]]:
+    """Get or build the rotation atlas: one surface holding the body at every whole
+    degree of its symmetry period, and per degree (area rect, half width, half height)."""
+    if not JUGGERNAUT_ATLAS_CACHE:
+        body = get_juggernaut_body()
+        rotations = [pygame.transform.rotate(body, -step) for step in range(JUGGERNAUT_BODY_SYMMETRY)]
+        cell = max(max(r.get_width(), r.get_height()) for r in rotations)
+        rows = -(-JUGGERNAUT_BODY_SYMMETRY // JUGGERNAUT_ATLAS_COLUMNS)
+        atlas = pygame.Surface((cell * JUGGERNAUT_ATLAS_COLUMNS, cell * rows), pygame.SRCALPHA)
+        
+        frames = []
+        for step, rotated in enumerate(rotations):
+            w, h = rotated.get_size()
+            area = pygame.Rect((step % JUGGERNAUT_ATLAS_COLUMNS) * cell, (step // JUGGERNAUT_ATLAS_COLUMNS) * cell, w, h)
+            atlas.blit(rotated, area, special_flags=pygame.BLEND_RGBA_MAX)  # Copy pixels, alpha included
+            frames.append((area, w // 2, h // 2))
+        JUGGERNAUT_ATLAS_CACHE.append((atlas, frames))
+    return JUGGERNAUT_ATLAS_CACHE[0]
+
 class Juggernaut:
     """
     The Juggernaut - A massive AI-controlled boss that attacks all players.
@@ -1016,14 +1414,24 @@ class Juggernaut:
     PHASE_CHARGE = 1
     PHASE_BURST = 2
     
+    BODY_SYMMETRY = JUGGERNAUT_BODY_SYMMETRY
+    
     def __init__(self, x: float, y: float, particles: ParticleSystem):
         self.x = x
         self.y = y
         self.radius = JUGGERNAUT_SIZE // 2
+        self.melee_reach_sq = (self.radius + TANK_SIZE // 2) ** 2  # Squared contact distance
+        
+        # Arena bounds for the blade's center, fixed for the Juggernaut's lifetime
+        self.min_x = self.radius
+        self.max_x = SCREEN_WIDTH - self.radius
+        self.min_y = self.radius
+        self.max_y = SCREEN_HEIGHT - self.radius
         self.particles = particles
         
         # Movement
-        self.vel = pygame.math.Vector2(0, 0)
+        self.vx = 0.0  # Plain floats: Vector2's math was never used
+        self.vy = 0.0
         
         # Visual rotation (spinning saw-blade effect)
         self.rotation = 0.0
@@ -1035,161 +1443,187 @@ class Juggernaut:
         self.burst_cooldown = 0.0
         self.target_angle = 0.0  # Turret tracking angle
         self.target_tank = None  # Current target
+        self.all_targets: List = []  # Tanks seen by the last update (alive filter applied when firing)
         
-        # Pre-render saw-blade surface
-        self._create_surfaces()
-    
-    def _create_surfaces(self):
-        """Pre-render the saw-blade body surface."""
-        size = JUGGERNAUT_SIZE + 20
-        self.body_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        center = size // 2
-        
-        # Outer glow
-        pygame.draw.circle(self.body_surface, (*JUGGERNAUT_COLOR, 80), (center, center), self.radius + 10)
-        
-        # Main body
-        pygame.draw.circle(self.body_surface, JUGGERNAUT_COLOR, (center, center), self.radius)
-        
-        # Saw-blade teeth (8 triangular notches)
-        for i in range(8):
-            angle = i * (math.pi / 4)
-            # Outer point
-            ox = center + math.cos(angle) * (self.radius + 15)
-            oy = center + math.sin(angle) * (self.radius + 15)
-            # Inner points
-            a1 = angle - 0.2
-            a2 = angle + 0.2
-            ix1 = center + math.cos(a1) * (self.radius - 5)
-            iy1 = center + math.sin(a1) * (self.radius - 5)
-            ix2 = center + math.cos(a2) * (self.radius - 5)
-            iy2 = center + math.sin(a2) * (self.radius - 5)
-            pygame.draw.polygon(self.body_surface, JUGGERNAUT_BLADE_COLOR, [(ox, oy), (ix1, iy1), (ix2, iy2)])
+        # Per-phase handlers, indexed by weapon_phase (PHASE_IDLE/CHARGE/BURST)
+        self._phase_handlers = (self._phase_idle, self._phase_charge, self._phase_burst)
+        self._turret_colors = (self._turret_color_idle, self._turret_color_charge, self._turret_color_burst)
         
-        # Inner ring
-        pygame.draw.circle(self.body_surface, (100, 30, 30), (center, center), self.radius // 2)
-        pygame.draw.circle(self.body_surface, (60, 15, 15), (center, center), self.radius // 3)
+        # Saw-blade body, shared with every other Juggernaut (see get_juggernaut_body)
+        self.body_surface = get_juggernaut_body()
     
     def find_nearest_target(self, tanks: List) -> Optional[any]:
         """Find the nearest alive player tank."""
         nearest = None
-        min_dist = float('inf')
+        min_dist_sq = float('inf')
+        x = self.x
+        y = self.y
         
         for tank in tanks:
             if tank.alive:
-                dist = distance(self.x, self.y, tank.x, tank.y)
-                if dist < min_dist:
-                    min_dist = dist
+                dx = tank.x - x
+                dy = tank.y - y
+                dist_sq = dx * dx + dy * dy
+                if dist_sq < min_dist_sq:
+                    min_dist_sq = dist_sq
                     nearest = tank
         
         return nearest
     
-    def update(self, dt: float, tanks: List, bullets: List):
-        """Update Juggernaut movement, AI, and weapon."""
+    def update(self, dt: float, tanks: List, bullets: List, alive_tanks: Optional[List] = None):
+        """Update Juggernaut movement, AI, and weapon.
+        
+        alive_tanks, when given, is the engine's maintained list of living
+        tanks and is used as-is instead of being rebuilt from tanks.
+        """
         # Spin the saw-blade
         self.rotation += JUGGERNAUT_ROTATION_SPEED * dt
         
-        # Store ALL alive tanks for omni-burst
-        self.all_targets = [t for t in tanks if t.alive]
+        # Nearest alive tank for movement; the omni-burst filters its targets
+        # from the same list only on the frames it actually fires
+        candidates = tanks if alive_tanks is None else alive_tanks
+        self.all_targets = candidates
+        self.target_tank = self.find_nearest_target(candidates)
         
-        # Find nearest target for movement
-        self.target_tank = self.find_nearest_target(tanks)
+        # Position is read once into locals and written back once
+        x = self.x
+        y = self.y
         
-        if self.target_tank:
+        target = self.target_tank
+        if target:
             # Move toward target (slow creep)
-            dx = self.target_tank.x - self.x
-            dy = self.target_tank.y - self.y
-            dist = max((dx*dx + dy*dy)**0.5, 1)
+            dx = target.x - x
+            dy = target.y - y
+            dist = max(math.sqrt(dx * dx + dy * dy), 1)
             
-            # Normalize and apply speed
-            self.vel.x = (dx / dist) * JUGGERNAUT_SPEED * dt
-            self.vel.y = (dy / dist) * JUGGERNAUT_SPEED * dt
+            # Normalize and apply speed (one division for both axes)
+            step = JUGGERNAUT_SPEED * dt / dist
+            vx = self.vx = dx * step
+            vy = self.vy = dy * step
             
-            self.x += self.vel.x
-            self.y += self.vel.y
+            x += vx
+            y += vy
             
             # Update turret tracking angle (for visual)
             self.target_angle = math.degrees(math.atan2(dy, dx))
         
-        # Keep in bounds
-        self.x = max(self.radius, min(SCREEN_WIDTH - self.radius, self.x))
-        self.y = max(self.radius, min(SCREEN_HEIGHT - self.radius, self.y))
+        # Keep in bounds (plain comparisons against the precomputed limits)
+        if x < self.min_x:
+            x = self.min_x
+        elif x > self.max_x:
+            x = self.max_x
+        if y < self.min_y:
+            y = self.min_y
+        elif y > self.max_y:
+            y = self.max_y
+        self.x = x
+        self.y = y
         
         # Weapon state machine
         self._update_weapon(dt, bullets)
     
     def _update_weapon(self, dt: float, bullets: List):
-        """Update burst cannon state machine."""
+        """Update burst cannon state machine (one handler per phase)."""
         self.weapon_timer += dt
-        
-        if self.weapon_phase == self.PHASE_IDLE:
-            if self.weapon_timer >= JUGGERNAUT_IDLE_TIME:
-                self.weapon_phase = self.PHASE_CHARGE
-                self.weapon_timer = 0.0
-        
-        elif self.weapon_phase == self.PHASE_CHARGE:
-            if self.weapon_timer >= JUGGERNAUT_CHARGE_TIME:
-                self.weapon_phase = self.PHASE_BURST
-                self.weapon_timer = 0.0
-                self.burst_count = 0
-                self.burst_cooldown = 0.0
-        
-        elif self.weapon_phase == self.PHASE_BURST:
-            self.burst_cooldown -= dt
-            
-            if self.burst_cooldown <= 0 and self.burst_count < JUGGERNAUT_BURST_COUNT:
-                # OMNI-BURST: Fire at ALL alive tanks simultaneously!
-                self._fire_omni_burst(bullets)
-                self.burst_count += 1
-                self.burst_cooldown = JUGGERNAUT_BURST_INTERVAL
-            
-            if self.burst_count >= JUGGERNAUT_BURST_COUNT:
-                self.weapon_phase = self.PHASE_IDLE
-                self.weapon_timer = 0.0
+        self._phase_handlers[self.weapon_phase](dt, bullets)
+    
+    def _phase_idle(self, dt: float, bullets: List):
+        """Idle: track, then start charging."""
+        if self.weapon_timer >= JUGGERNAUT_IDLE_TIME:
+            self.weapon_phase = self.PHASE_CHARGE
+            self.weapon_timer = 0.0
+    
+    def _phase_charge(self, dt: float, bullets: List):
+        """Charge: glow, then start the burst."""
+        if self.weapon_timer >= JUGGERNAUT_CHARGE_TIME:
+            self.weapon_phase = self.PHASE_BURST
+            self.weapon_timer = 0.0
+            self.burst_count = 0
+            self.burst_cooldown = 0.0
+    
+    def _phase_burst(self, dt: float, bullets: List):
+        """Burst: fire JUGGERNAUT_BURST_COUNT volleys, then back to idle."""
+        self.burst_cooldown -= dt
+        
+        if self.burst_cooldown <= 0 and self.burst_count < JUGGERNAUT_BURST_COUNT:
+            # OMNI-BURST: Fire at ALL alive tanks simultaneously!
+            self._fire_omni_burst(bullets)
+            self.burst_count += 1
+            self.burst_cooldown = JUGGERNAUT_BURST_INTERVAL
+        
+        if self.burst_count >= JUGGERNAUT_BURST_COUNT:
+            self.weapon_phase = self.PHASE_IDLE
+            self.weapon_timer = 0.0
     
     def _fire_omni_burst(self, bullets: List):
         """Fire heavy bullets at ALL alive tanks simultaneously."""
-        if not self.all_targets:
+        targets = [t for t in self.all_targets if t.alive]
+        if not targets:
             return
         
-        for target in self.all_targets:
+        # Loop invariants hoisted: a burst can fire at every tank at once
+        x = self.x
+        y = self.y
+        muzzle_dist = self.radius + 10
+        speed = JUGGERNAUT_BULLET_SPEED
+        damage = JUGGERNAUT_BULLET_DAMAGE
+        atan2 = math.atan2
+        hypot = math.hypot
+        degrees = math.degrees
+        acquire = BULLET_POOL.acquire
+        spawn_flash = self.particles.spawn_muzzle_flash_rad
+        append = bullets.append
+        
+        for target in targets:
             # Calculate angle to this specific target
-            dx = target.x - self.x
-            dy = target.y - self.y
-            target_angle = math.degrees(math.atan2(dy, dx))
-            angle_rad = math.radians(target_angle)
+            dx = target.x - x
+            dy = target.y - y
+            angle_rad = atan2(dy, dx)
+            
+            # Direction from the offset itself: cos/sin of the aim are dx/d, dy/d
+            dist = hypot(dx, dy)
+            if dist > 0:
+                cos_a = dx / dist
+                sin_a = dy / dist
+            else:
+                cos_a, sin_a = 1.0, 0.0  # atan2(0, 0) == 0
             
             # Spawn bullet at turret position toward this target
-            bx = self.x + math.cos(angle_rad) * (self.radius + 10)
-            by = self.y + math.sin(angle_rad) * (self.radius + 10)
+            bx = x + cos_a * muzzle_dist
+            by = y + sin_a * muzzle_dist
             
-            # Create bullet
-            bullet = Bullet(bx, by, target_angle, -1, (255, 100, 100))
+            # Create bullet (degrees only for the Bullet's angle)
+            bullet = acquire(bx, by, degrees(angle_rad), -1, (255, 100, 100))
             
             # Override with Juggernaut's heavy bullet stats
-            bullet.vx = math.cos(angle_rad) * JUGGERNAUT_BULLET_SPEED
-            bullet.vy = math.sin(angle_rad) * JUGGERNAUT_BULLET_SPEED
-            bullet.damage = JUGGERNAUT_BULLET_DAMAGE
+            bullet.vx = cos_a * speed
+            bullet.vy = sin_a * speed
+            bullet.damage = damage
             bullet.is_critical = False
             
-            bullets.append(bullet)
+            append(bullet)
             
             # Muzzle flash for each bullet
-            self.particles.spawn_muzzle_flash(bx, by, target_angle, (255, 150, 100))
+            spawn_flash(bx, by, angle_rad, (255, 150, 100))
         
         # Single sound for the burst
         play_sound(SFX_SHOOT, VOL_SHOOT)
     
-    def check_melee(self, tank) -> bool:
-        """Check if tank is touching the Juggernaut."""
-        dist = distance(self.x, self.y, tank.x, tank.y)
-        return dist < self.radius + TANK_SIZE // 2
-    
-    def apply_melee_damage(self, tank):
-        """Apply contact damage and knockback to tank."""
-        if not self.check_melee(tank):
-            return
-        
+    def tanks_in_melee(self, tanks: List) -> List:
+        """Tanks touching the Juggernaut, in one pass (pass alive tanks only), boss position read once."""
+        x = self.x
+        y = self.y
+        reach_sq = self.melee_reach_sq
+        touching = []
+        for tank in tanks:
+            dx = tank.x - x
+            dy = tank.y - y
+            if dx * dx + dy * dy < reach_sq:
+                touching.append(tank)
+        return touching
+    
+    def apply_melee_hit(self, tank):
+        """Apply contact damage and knockback to a tank from tanks_in_melee()."""
         # Damage (per frame, called every update)
         tank.take_damage(JUGGERNAUT_MELEE_DAMAGE)
         
@@ -1201,30 +1635,35 @@ class Juggernaut:
         """Draw the Juggernaut with spinning effect."""
         pos = camera.apply((self.x, self.y))
         
-        # Rotate and blit body
-        rotated_body = pygame.transform.rotate(self.body_surface, -self.rotation)
-        body_rect = rotated_body.get_rect(center=pos)
-        surface.blit(rotated_body, body_rect)
+        # Blit the cached rotation (whole degrees, modulo the blade's symmetry) out of the atlas
+        atlas, frames = get_juggernaut_atlas()
+        area, half_w, half_h = frames[round(self.rotation) % self.BODY_SYMMETRY]
+        surface.blit(atlas, (pos[0] - half_w, pos[1] - half_h), area)
         
         # Draw turret on top
         turret_len = JUGGERNAUT_TURRET_SIZE
-        angle_rad = math.radians(self.target_angle)
-        tx = pos[0] + math.cos(angle_rad) * turret_len
-        ty = pos[1] + math.sin(angle_rad) * turret_len
+        cos_a, sin_a = UNIT_VECTOR_LUT[round(self.target_angle) % 360]
+        tx = pos[0] + cos_a * turret_len
+        ty = pos[1] + sin_a * turret_len
         
         # Turret color changes during charge/burst
-        if self.weapon_phase == self.PHASE_CHARGE:
-            # Flashing warning glow
-            flash = abs(math.sin(self.weapon_timer * 10))
-            turret_color = (255, int(100 + flash * 155), int(flash * 100))
-        elif self.weapon_phase == self.PHASE_BURST:
-            turret_color = (255, 255, 200)  # Bright during firing
-        else:
-            turret_color = (150, 50, 50)
+        turret_color = self._turret_colors[self.weapon_phase]()
         
         pygame.draw.line(surface, turret_color, pos, (tx, ty), 8)
         pygame.draw.circle(surface, turret_color, (int(tx), int(ty)), 6)
     
+    def _turret_color_idle(self) -> Tuple[int, int, int]:
+        """Turret color while idle."""
+        return (150, 50, 50)
+    
+    def _turret_color_charge(self) -> Tuple[int, int, int]:
+        """Turret color while charging: flashing warning glow, from the per-phase table."""
+        return JUGGERNAUT_CHARGE_COLORS[int(self.weapon_timer * JUGGERNAUT_FLASH_SCALE) & (JUGGERNAUT_FLASH_STEPS - 1)]
+    
+    def _turret_color_burst(self) -> Tuple[int, int, int]:
+        """Turret color while firing: bright."""
+        return (255, 255, 200)
+    
     def get_context_data(self) -> Dict:
         """Return data for bot context."""
         return {
@@ -1240,6 +1679,34 @@ class Juggernaut:
 # =============================================================================
 
 
+# Actions a bot's update() may return (set: membership is one hash lookup)
+BOT_ACTIONS = frozenset(("MOVE", "SHOOT", "STOP", "MOVE_AND_SHOOT"))
+
+# Monotonic, high-resolution clock for bot timeouts (time.time() can jump or tick at ~1 ms)
+bot_clock = time.perf_counter
+
+# Folder scanned for bot_*.py files (see GitWarsEngine.scan_bots)
+BOTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bots")
+
+def clone_context(context: Dict) -> Dict:
+    """
+    Fast deep copy of a bot context, specialized to the shape build_context()
+    produces: values are primitives, dicts of primitives, or lists of such dicts.
+    Anything else falls back to copy.deepcopy, so bots still can't share state.
+    """
+    clone = {}
+    for key, value in context.items():
+        value_type = type(value)
+        if value_type is list:
+            clone[key] = [item.copy() if type(item) is dict else copy.deepcopy(item) for item in value]
+        elif value_type is dict:
+            clone[key] = value.copy()
+        elif value is None or value_type in (int, float, str, bool):
+            clone[key] = value
+        else:
+            clone[key] = copy.deepcopy(value)
+    return clone
+
 class BotLoader:
     """Safely loads and executes student bot scripts."""
     
@@ -1249,6 +1716,7 @@ class BotLoader:
         self.update_func: Optional[Callable] = None
         self.error_message: Optional[str] = None
         self.error_logged = False  # Prevent spam - log each error once
+        self.uses_sensors = True  # Cleared by load_bot if the bot sets USES_SENSORS = False
         self.load_bot()
     
     def _log_error(self, error_type: str, error: Exception, show_traceback: bool = True):
@@ -1279,6 +1747,10 @@ class BotLoader:
                 if hasattr(module, 'update'):
                     self.update_func = module.update
                     print(f"✅ Loaded bot: {self.bot_name}")
+                    
+                    # Raycast sensors are the priciest part of the context: bots that
+                    # never read them can opt out with USES_SENSORS = False
+                    self.uses_sensors = bool(getattr(module, "USES_SENSORS", True))
                 else:
                     self.error_message = "Bot missing update() function"
                     print(f"⚠️  {self.bot_name}: Missing update() function!")
@@ -1292,19 +1764,19 @@ class BotLoader:
             return None, None
         
         # Pass a DEEP COPY to prevent cheating
-        safe_context = copy.deepcopy(context)
+        safe_context = clone_context(context)
         
         try:
-            start_time = time.time()
+            start_time = bot_clock()
             result = self.update_func(safe_context)
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ms = (bot_clock() - start_time) * 1000
             
             if elapsed_ms > BOT_TIMEOUT_MS:
                 return "LAG", None
             
             if isinstance(result, tuple) and len(result) == 2:
                 action, param = result
-                if action in ["MOVE", "SHOOT", "STOP", "MOVE_AND_SHOOT"]:
+                if action in BOT_ACTIONS:
                     return action, param
             
             return None, None
@@ -1330,10 +1802,26 @@ class GitWarsEngine:
         self.particles = ParticleSystem()
         
         self.tanks: List[Tank] = []
+        self.ranked_tanks: List[Tank] = []  # Tanks by coins, most first: re-sorted only when coins change (Mode 1)
+        self.ranking_dirty = True
+        self.alive_tanks: List[Tank] = []  # Maintained by setup_game/on_tank_death
         self.bullets: List[Bullet] = []
         self.coins: List[Coin] = []
         self.walls: List[Wall] = []
+        self.wall_rects: List[pygame.Rect] = []  # Walls never move: rects cached per level
+        self.bullet_wall_grid: Dict[Tuple[int, int], List[pygame.Rect]] = {}  # Broad phase for bullets
+        self.tank_wall_grid: Dict[Tuple[int, int], List[pygame.Rect]] = {}  # Broad phase for tanks
         self.bots: Dict[int, BotLoader] = {}
+        self._real_bots: List[Tuple[str, str]] = []  # See scan_bots
+        self._bots_dir_mtime: Optional[int] = None
+        
+        # Shared per-frame bot context (see build_frame_context)
+        self.frame_enemies: List[Dict] = []
+        self.frame_coins: List[Dict] = []
+        self.frame_walls: List[Dict] = []
+        self.frame_bullets: List[Tuple[int, Dict]] = []
+        self.frame_juggernaut: Optional[Dict] = None
+        self.bot_contexts: Dict[int, Dict] = {}  # One context dict per tank id, refilled each frame
         
         self.zone = Zone()
         self.juggernaut = None  # Spawned in Mode 3
@@ -1364,37 +1852,55 @@ class GitWarsEngine:
             3: self.font_medium.render("THE JUGGERNAUT", True, COLOR_TEXT)
         }
         
+        # Rendered HUD text by (font, text, color); see render_text
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+        
+        # Pre-render the static grid background (one blit per frame instead of a line per cell)
+        self._background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._background.fill(COLOR_BACKGROUND)
+        for x in range(0, SCREEN_WIDTH + 1, GRID_CELL_SIZE):
+            pygame.draw.line(self._background, COLOR_GRID, (x, 0), (x, SCREEN_HEIGHT), 1)
+        for y in range(0, SCREEN_HEIGHT + 1, GRID_CELL_SIZE):
+            pygame.draw.line(self._background, COLOR_GRID, (0, y), (SCREEN_WIDTH, y), 1)
+        self._background = self._background.convert()
+        
+        # Game over screen: the darkening overlay and restart hint never change,
+        # the winner lines are rendered once per winner_text (see draw_game_over)
+        self._game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._game_over_overlay.fill((0, 0, 0))
+        self._game_over_overlay.set_alpha(180)
+        self._game_over_hint = self.font_small.render("Press R to restart | ESC to quit", True, COLOR_GRID_ACCENT)
+        self._game_over_text: Optional[str] = None
+        self._game_over_lines: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        
         # Initialize game
         self.setup_game()
     
     def setup_game(self):
         """Set up game based on current mode."""
         self.tanks.clear()
+        for bullet in self.bullets:
+            BULLET_POOL.release(bullet)
         self.bullets.clear()
         self.coins.clear()
         self.walls.clear()
+        self.wall_rects.clear()
+        self.frame_walls = []
+        self.bullet_wall_grid.clear()
+        self.tank_wall_grid.clear()
         self.bots.clear()
-        self.particles.particles.clear()  # Clear particles too
-        self.last_top5 = []  # Track top 5 ranking for coin sound on rank change
+        self.bot_contexts.clear()
+        self.particles.clear()  # Clear particles too
+        self.last_top5: Tuple[int, ...] = ()  # Top 5 ids in rank order, for the coin sound on a change
+        self.ranking_dirty = True  # Re-sort ranked_tanks on the next update
         
         # Spawn tanks in circle
         num_tanks = BOT_DEFAULT_COUNT if self.game_mode != 3 else 2
         center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
         radius = min(SCREEN_WIDTH, SCREEN_HEIGHT) // 3
         
-        # Scan bots folder for all bot_*.py files
-        import glob
-        bots_dir = os.path.join(os.path.dirname(__file__), "bots")
-        bot_files = sorted(glob.glob(os.path.join(bots_dir, "bot_*.py")))
-        
-        # Separate real bots from dummy bot
-        dummy_bot_path = os.path.join(bots_dir, "bot_dummy.py")
-        real_bots = []
-        for bot_file in bot_files:
-            filename = os.path.basename(bot_file)
-            team_name = filename[4:-3]  # Remove "bot_" prefix and ".py" suffix
-            if team_name != "dummy":
-                real_bots.append((bot_file, team_name))
+        real_bots = self.scan_bots()
+        dummy_bot_path = os.path.join(BOTS_DIR, "bot_dummy.py")
         
         for i in range(num_tanks):
             angle = (2 * math.pi * i) / num_tanks
@@ -1422,6 +1928,9 @@ class GitWarsEngine:
             
             self.tanks.append(tank)
         
+        self.alive_tanks = list(self.tanks)
+        self.ranked_tanks = list(self.tanks)
+        
         # Mode-specific setup
         if self.game_mode == 2:
             self.generate_maze()
@@ -1461,6 +1970,27 @@ class GitWarsEngine:
         # Play Start Sound (on reserved channel so it won't get cut off)
         play_critical_sound(SFX_READY, VOL_READY)
     
+    def scan_bots(self) -> List[Tuple[str, str]]:
+        """
+        List (bot file, team name) for every real bot in bots/, sorted by file.
+        The folder is only re-globbed when its mtime changes (a bot file was
+        added, removed or renamed), so a restart costs one stat() call.
+        """
+        try:
+            mtime = os.stat(BOTS_DIR).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if mtime is None or mtime != self._bots_dir_mtime:
+            self._real_bots = []
+            for bot_file in sorted(glob.glob(os.path.join(BOTS_DIR, "bot_*.py"))):
+                team_name = os.path.basename(bot_file)[4:-3]  # Remove "bot_" prefix and ".py" suffix
+                if team_name != "dummy":
+                    self._real_bots.append((bot_file, team_name))
+            self._bots_dir_mtime = mtime
+        
+        return self._real_bots
+    
     def generate_maze(self):
         """Generate walls for labyrinth mode."""
         # Simple symmetrical maze
@@ -1479,6 +2009,14 @@ class GitWarsEngine:
         
         for x, y, w, h in wall_positions:
             self.walls.append(Wall(x, y, w, h))
+        
+        self.wall_rects = [wall.get_rect() for wall in self.walls]
+        self.frame_walls = [wall.get_context() for wall in self.walls]  # Walls never change: built once per level
+        # +1: bullet rects are truncated to whole pixels
+        self.bullet_wall_grid = build_wall_grid(self.wall_rects, BULLET_SIZE + 1)
+        # A full tank size (not half): a tank pushed out of one wall can land
+        # against the next, which must still be listed for its starting cell
+        self.tank_wall_grid = build_wall_grid(self.wall_rects, TANK_SIZE)
     
     def spawn_coin(self):
         """Spawn a new coin at random position."""
@@ -1486,13 +2024,14 @@ class GitWarsEngine:
             return
         
         # Avoid spawning on tanks
+        min_gap_sq = (TANK_SIZE * 2) ** 2
         for _ in range(10):
             x = random.randint(50, SCREEN_WIDTH - 50)
             y = random.randint(50, SCREEN_HEIGHT - 50)
             
             valid = True
             for tank in self.tanks:
-                if distance(x, y, tank.x, tank.y) < TANK_SIZE * 2:
+                if distance_sq(x, y, tank.x, tank.y) < min_gap_sq:
                     valid = False
                     break
             
@@ -1509,49 +2048,63 @@ class GitWarsEngine:
         
         self.danger_zones.append(DangerZone(x, y, self.particles))
     
-    def build_context(self, tank: Tank) -> Dict:
-        """Build the context dictionary for a tank's bot."""
-        enemies = []
-        for other in self.tanks:
-            if other.id != tank.id and other.alive:
-                enemies.append({
-                    "x": other.x,
-                    "y": other.y,
-                    "id": other.id
-                })
-        
-        coin_data = []
-        if self.game_mode == 1:
-            for coin in self.coins:
-                if not coin.collected:
-                    coin_data.append({"x": coin.x, "y": coin.y})
-        
-        wall_data = [wall.get_context() for wall in self.walls]
+    def build_frame_context(self):
+        """
+        Build the parts of the bot context that are the same for every tank this
+        frame, once, instead of once per tank. build_context() then only filters
+        out the tank's own entries. Bots get a clone (clone_context), so sharing
+        these lists between tanks is safe. frame_walls is built in generate_maze.
+        """
+        self.frame_enemies = [{"x": t.x, "y": t.y, "id": t.id} for t in self.alive_tanks]
         
-        bullet_data = []
-        for bullet in self.bullets:
-            if bullet.owner_id != tank.id:
-                bullet_data.append({
-                    "x": bullet.x,
-                    "y": bullet.y,
-                    "vx": bullet.vx,
-                    "vy": bullet.vy
-                })
+        if self.game_mode == 1:
+            self.frame_coins = [{"x": coin.x, "y": coin.y} for coin in self.coins if not coin.collected]
+        else:
+            self.frame_coins = []
         
-        # Get sensor readings for obstacle avoidance
-        sensor_readings = get_sensor_readings(tank.x, tank.y, tank.angle, self.walls)
+        # (owner id, bullet data); extended in build_context as bots fire this frame
+        self.frame_bullets = [
+            (bullet.owner_id, {"x": bullet.x, "y": bullet.y, "vx": bullet.vx, "vy": bullet.vy})
+            for bullet in self.bullets
+        ]
         
-        return {
-            "me": tank.get_context(),
-            "enemies": enemies,
-            "coins": coin_data,
-            "walls": wall_data,
-            "bullets": bullet_data,
-            "sensors": sensor_readings,  # NEW: Raycast sensors for wall detection
-            "juggernaut": self.juggernaut.get_context_data() if self.juggernaut and self.game_mode == 3 else None,
-            "game_mode": self.game_mode,
-            "time_left": self.game_timer
-        }
+        self.frame_juggernaut = self.juggernaut.get_context_data() if self.juggernaut and self.game_mode == 3 else None
+    
+    def build_context(self, tank: Tank) -> Dict:
+        """Build the context dictionary for a tank's bot (after build_frame_context)."""
+        tank_id = tank.id
+        enemies = [enemy for enemy in self.frame_enemies if enemy["id"] != tank_id]
+        
+        # Bullets fired by bots earlier in this frame are visible to the later ones
+        frame_bullets = self.frame_bullets
+        if len(self.bullets) > len(frame_bullets):
+            for bullet in self.bullets[len(frame_bullets):]:
+                frame_bullets.append(
+                    (bullet.owner_id, {"x": bullet.x, "y": bullet.y, "vx": bullet.vx, "vy": bullet.vy})
+                )
+        bullet_data = [data for owner_id, data in frame_bullets if owner_id != tank_id]
+        
+        # Get sensor readings for obstacle avoidance (only for bots that read them)
+        bot = self.bots.get(tank_id)
+        if bot is None or bot.uses_sensors:
+            sensor_readings = get_sensor_readings(tank.x, tank.y, tank.angle, self.wall_rects)
+        else:
+            sensor_readings = None
+        
+        # Refill the tank's reusable context dict in place (bots only ever see a clone)
+        context = self.bot_contexts.get(tank_id)
+        if context is None:
+            context = self.bot_contexts[tank_id] = {}
+        context["me"] = tank.get_context()
+        context["enemies"] = enemies
+        context["coins"] = self.frame_coins
+        context["walls"] = self.frame_walls
+        context["bullets"] = bullet_data
+        context["sensors"] = sensor_readings  # NEW: Raycast sensors for wall detection
+        context["juggernaut"] = self.frame_juggernaut
+        context["game_mode"] = self.game_mode
+        context["time_left"] = self.game_timer
+        return context
     
     def process_bot_action(self, tank: Tank, action: str, param: any):
         """Process a bot's action."""
@@ -1575,8 +2128,8 @@ class GitWarsEngine:
                 pass
         
         elif action == "STOP":
-            tank.velocity.x = 0
-            tank.velocity.y = 0
+            tank.vx = 0.0
+            tank.vy = 0.0
         
         elif action == "MOVE_AND_SHOOT" and param is not None:
             # Strafing: Move AND shoot in the same frame!
@@ -1611,70 +2164,110 @@ class GitWarsEngine:
         self.particles.update()
         
         # Update kill feed timers (fade out over time)
-        if self.game_mode == 2:
-            for msg in self.kill_feed:
-                msg["timer"] -= dt
+        if self.game_mode == 2 and self.kill_feed:
+            kill_feed = self.kill_feed
+            write = 0
+            for msg in kill_feed:
+                timer = msg["timer"] - dt
+                msg["timer"] = timer
                 # Fade alpha as timer approaches 0
-                if msg["timer"] < 1.0:
-                    msg["alpha"] = int(255 * msg["timer"])
-            # Remove expired messages
-            self.kill_feed = [m for m in self.kill_feed if m["timer"] > 0]
+                if timer < 1.0:
+                    msg["alpha"] = int(255 * timer)
+                # Keep live messages, compacted to the front in place
+                if timer > 0:
+                    kill_feed[write] = msg
+                    write += 1
+            del kill_feed[write:]
         
         # =====================================================================
         # PHYSICS LOOP REORDERING (Bullets/Collisions FIRST, then Tanks)
         # =====================================================================
         
         # 1. Update Bullets & Resolve Collisions (Apply Forces)
+        # One pass per bullet: trail point, move, bounds check, then collisions
+        wall_grid = self.bullet_wall_grid
+        cell = GRID_CELL_SIZE
+        width = SCREEN_WIDTH
+        height = SCREEN_HEIGHT
+        
+        # Tanks don't move during the bullet pass: take their rects once, in
+        # self.tanks order, and let collidelistall do the per-bullet scan in C
+        hit_tanks = self.alive_tanks[:]
+        hit_rects = [tank.get_rect() for tank in hit_tanks]
+        
         for bullet in self.bullets:
-            bullet.update()
+            x = bullet.x
+            y = bullet.y
+            bullet.trail.positions.append((x, y))  # Trail.add_point, inlined
+            x += bullet.vx
+            y += bullet.vy
+            bullet.x = x
+            bullet.y = y
+            
+            # Check bounds
+            if x < 0 or x > width or y < 0 or y > height:
+                bullet.alive = False
             
-            # Wall collision
+            # Wall collision: only the walls bucketed in the bullet's grid cell can be touching it
             bullet_rect = bullet.get_rect()
-            for wall in self.walls:
-                if bullet_rect.colliderect(wall.get_rect()):
-                    bullet.alive = False
-                    break
+            nearby_walls = wall_grid.get((int(x // cell), int(y // cell)))
+            if nearby_walls and bullet_rect.collidelist(nearby_walls) != -1:
+                bullet.alive = False
             
-            # Tank collision
-            for tank in self.tanks:
+            # Tank collision: first live, non-owner tank the bullet overlaps
+            for index in bullet_rect.collidelistall(hit_rects):
+                tank = hit_tanks[index]
                 if tank.alive and tank.id != bullet.owner_id:
-                    if bullet_rect.colliderect(tank.get_rect()):
-                        bullet.alive = False
-                        
-                        if self.game_mode == 1:
-                            # Knockback only
-                            angle = angle_to(bullet.x, bullet.y, tank.x, tank.y)
-                            tank.apply_knockback(angle, SCRAMBLE_KNOCKBACK)
-                        else:
-                            # Damage
-                            tank.take_damage(bullet.damage)
-                            if not tank.alive:
-                                self.on_tank_death(tank)
-                        break
-        
-        # Remove dead bullets
-        self.bullets = [b for b in self.bullets if b.alive]
+                    bullet.alive = False
+                    
+                    if self.game_mode == 1:
+                        # Knockback only
+                        angle = angle_to(bullet.x, bullet.y, tank.x, tank.y)
+                        tank.apply_knockback(angle, SCRAMBLE_KNOCKBACK)
+                    else:
+                        # Damage
+                        tank.take_damage(bullet.damage)
+                        if not tank.alive:
+                            self.on_tank_death(tank)
+                    break
         
-        # 2. Execute Bot Logic (Apply Input Forces BEFORE physics update)
-        for tank in self.tanks:
-            if tank.alive and tank.id in self.bots:
-                context = self.build_context(tank)
-                action, param = self.bots[tank.id].execute(context)
+        # Remove dead bullets in place (no new list), recycling them through the pool
+        bullets = self.bullets
+        write = 0
+        for bullet in bullets:
+            if bullet.alive:
+                bullets[write] = bullet
+                write += 1
+            else:
+                BULLET_POOL.release(bullet)
+        if write != len(bullets):
+            del bullets[write:]
+        
+        # 2. Execute Bot Logic, then 3. Update Tanks, in one pass over the alive tanks.
+        # Each tank's input forces are still applied BEFORE its own physics step.
+        # Bots see enemies through the frame snapshot (build_frame_context), so a
+        # tank moving before a later tank's bot runs changes nothing it reads.
+        # Neither step can kill a tank, so alive_tanks is stable during the loop.
+        self.build_frame_context()
+        bots = self.bots
+        walls = self.walls
+        tank_wall_grid = self.tank_wall_grid
+        for tank in self.alive_tanks:
+            bot = bots.get(tank.id)
+            if bot is not None:
+                action, param = bot.execute(self.build_context(tank))
                 tank.last_action = action
                 if action and action != "LAG":
                     self.process_bot_action(tank, action, param)
+            tank.update(dt, walls, tank_wall_grid)
+        
+        # Zone damage (Mode 2)
+        if self.game_mode == 2:
+            for tank in self.zone.tanks_in_danger(self.alive_tanks):
+                tank.take_damage(LABYRINTH_ZONE_DAMAGE * dt)
+                if not tank.alive:
+                    self.on_tank_death(tank)
         
-        # 3. Update Tanks (Integrate Physics - AFTER all forces applied)
-        for tank in self.tanks:
-            if tank.alive:
-                tank.update(dt, self.walls)
-                
-                # Zone damage (Mode 2)
-                if self.game_mode == 2 and self.zone.is_in_danger(tank.x, tank.y):
-                    tank.take_damage(LABYRINTH_ZONE_DAMAGE * dt)
-                    if not tank.alive:
-                        self.on_tank_death(tank)
-                
         # Update timers
         if self.game_mode == 1:
             self.game_timer -= dt
@@ -1696,33 +2289,35 @@ class GitWarsEngine:
                 self.danger_zone_timer = 0.0
                 self.spawn_danger_zone()
             
-            # Update danger zones
-            for dz in self.danger_zones[:]:
-                if not dz.update(dt):
-                    self.danger_zones.remove(dz)
-                else:
+            # Update danger zones, compacting expired ones out in place
+            danger_zones = self.danger_zones
+            write = 0
+            for dz in danger_zones:
+                if dz.update(dt):
+                    danger_zones[write] = dz
+                    write += 1
+                    
                     # Apply damage to tanks inside active zones
-                    for tank in self.tanks:
-                        if tank.alive:
-                            dz.apply_damage(tank)
-                            if not tank.alive:
-                                self.on_tank_death(tank)
+                    for tank in dz.tanks_hit(self.alive_tanks):
+                        dz.apply_hit(tank)
+                        if not tank.alive:
+                            self.on_tank_death(tank)
+            if write != len(danger_zones):
+                del danger_zones[write:]
             
-            alive_count = sum(1 for t in self.tanks if t.alive)
-            if alive_count <= LABYRINTH_FINAL_SURVIVORS:
+            if len(self.alive_tanks) <= LABYRINTH_FINAL_SURVIVORS:
                 self.end_labyrinth()
         
         elif self.game_mode == 3:
             # Update Juggernaut (movement, AI, weapon)
             if self.juggernaut:
-                self.juggernaut.update(dt, self.tanks, self.bullets)
+                self.juggernaut.update(dt, self.tanks, self.bullets, self.alive_tanks)
                 
                 # Apply melee damage to ALL tanks touching Juggernaut
-                for tank in self.tanks:
-                    if tank.alive:
-                        self.juggernaut.apply_melee_damage(tank)
-                        if not tank.alive:
-                            self.on_tank_death(tank)
+                for tank in self.juggernaut.tanks_in_melee(self.alive_tanks):
+                    self.juggernaut.apply_melee_hit(tank)
+                    if not tank.alive:
+                        self.on_tank_death(tank)
 
         # (Bullets updated earlier)
         
@@ -1733,29 +2328,43 @@ class GitWarsEngine:
                     continue
                 coin.update(dt)
                 
-                for tank in self.tanks:
-                    if tank.alive and coin.get_rect().colliderect(tank.get_rect()):
+                for tank in self.alive_tanks:
+                    if coin.get_rect().colliderect(tank.get_rect()):
                         coin.collected = True
                         tank.coins += COIN_VALUE
+                        self.ranking_dirty = True
                         break
             
-            self.coins = [c for c in self.coins if not c.collected]
+            # Drop collected coins in place
+            coins = self.coins
+            write = 0
+            for coin in coins:
+                if not coin.collected:
+                    coins[write] = coin
+                    write += 1
+            if write != len(coins):
+                del coins[write:]
             
-            # Check if top 5 ranking changed - play coin sound only on rank change
-            sorted_tanks = sorted(self.tanks, key=lambda t: t.coins, reverse=True)
-            current_top5 = [t.id for t in sorted_tanks[:5]]
-            if current_top5 != self.last_top5:
-                play_sound(SFX_COIN, VOL_COIN)  # Ranking changed!
-                self.last_top5 = current_top5
+            # Re-rank only when coins changed; then play coin sound only on rank change
+            if self.ranking_dirty:
+                self.ranking_dirty = False
+                self.ranked_tanks = sorted(self.tanks, key=lambda t: t.coins, reverse=True)
+                current_top5 = tuple(t.id for t in self.ranked_tanks[:5])
+                if current_top5 != self.last_top5:
+                    play_sound(SFX_COIN, VOL_COIN)  # Ranking changed!
+                    self.last_top5 = current_top5
         
         # Check game end (Mode 3)
         if self.game_mode == 3:
-            alive_tanks = [t for t in self.tanks if t.alive]
+            alive_tanks = self.alive_tanks
             if len(alive_tanks) <= 1:
                 self.end_duel(alive_tanks[0] if alive_tanks else None)
     
     def on_tank_death(self, tank: Tank):
         """Handle tank death effects."""
+        if tank in self.alive_tanks:
+            self.alive_tanks.remove(tank)
+        
         # Explosion particles
         self.particles.spawn_explosion(tank.x, tank.y, tank.color)
         
@@ -1791,9 +2400,8 @@ class GitWarsEngine:
     def end_labyrinth(self):
         """End The Labyrinth mode."""
         self.game_over = True
-        survivors = [t for t in self.tanks if t.alive]
         self.winner_text = "LABYRINTH SURVIVORS:\n"
-        for tank in survivors:
+        for tank in self.alive_tanks:
             name = getattr(tank, 'team_name', f'Tank_{tank.id}')
             self.winner_text += f"\n{name}"
             
@@ -1813,14 +2421,22 @@ class GitWarsEngine:
         play_critical_sound(SFX_WIN_3, VOL_WIN)
     
     def draw_background(self):
-        """Draw the neon grid background."""
-        self.screen.fill(COLOR_BACKGROUND)
-        
-        # Grid lines - OPTIMIZED: draw fewer lines
-        for x in range(0, SCREEN_WIDTH + 1, GRID_CELL_SIZE):
-            pygame.draw.line(self.screen, COLOR_GRID, (x, 0), (x, SCREEN_HEIGHT), 1)
-        for y in range(0, SCREEN_HEIGHT + 1, GRID_CELL_SIZE):
-            pygame.draw.line(self.screen, COLOR_GRID, (0, y), (SCREEN_WIDTH, y), 1)
+        """Draw the neon grid background (pre-rendered in __init__)."""
+        self.screen.blit(self._background, (0, 0))
+    
+    def render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render text through a small cache: the timer, FPS and scoreboard strings
+        repeat for many frames, so each distinct string is rasterized once.
+        The oldest entry is dropped once TEXT_CACHE_SIZE is reached.
+        """
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
     
     def draw_ui(self):
         """Draw the game UI."""
@@ -1833,23 +2449,22 @@ class GitWarsEngine:
         if self.game_mode in [1, 3]:
             mins = int(self.game_timer // 60)
             secs = int(self.game_timer % 60)
-            timer_text = self.font_medium.render(f"{mins}:{secs:02d}", True, COLOR_TEXT)
+            timer_text = self.render_text(self.font_medium, f"{mins}:{secs:02d}", COLOR_TEXT)
             self.screen.blit(timer_text, (SCREEN_WIDTH - 120, 20))
         
         # Scoreboard (Mode 1)
         if self.game_mode == 1:
-            sorted_tanks = sorted(self.tanks, key=lambda t: t.coins, reverse=True)
             y_offset = 80
-            for i, tank in enumerate(sorted_tanks[:5]):
+            for i, tank in enumerate(self.ranked_tanks[:5]):
                 color = tank.color if tank.alive else (100, 100, 100)
                 name = getattr(tank, 'team_name', f'Tank_{tank.id}')
-                score_text = self.font_small.render(f"{name}: {tank.coins}", True, color)
+                score_text = self.render_text(self.font_small, f"{name}: {tank.coins}", color)
                 self.screen.blit(score_text, (20, y_offset + i * 30))
         
         # Alive count (Mode 2)
         if self.game_mode == 2:
-            alive = sum(1 for t in self.tanks if t.alive)
-            alive_text = self.font_small.render(f"Alive: {alive}", True, COLOR_TEXT)
+            alive = len(self.alive_tanks)
+            alive_text = self.render_text(self.font_small, f"Alive: {alive}", COLOR_TEXT)
             self.screen.blit(alive_text, (SCREEN_WIDTH - 120, 20))
             
             # Kill feed messages (fading death notifications)
@@ -1857,35 +2472,38 @@ class GitWarsEngine:
             for i, msg in enumerate(self.kill_feed[:5]):  # Show max 5 messages
                 if msg["alpha"] > 0:
                     alpha = msg["alpha"]
-                    text_surface = self.font_small.render(msg["text"], True, (255, 80, 80))
+                    text_surface = self.render_text(self.font_small, msg["text"], (255, 80, 80))
                     text_surface.set_alpha(alpha)
                     self.screen.blit(text_surface, (SCREEN_WIDTH - text_surface.get_width() - 20, y_offset + i * 28))
         
         # FPS
         if SHOW_FPS:
-            fps = self.font_small.render(f"FPS: {int(self.clock.get_fps())}", True, COLOR_GRID_ACCENT)
+            fps = self.render_text(self.font_small, f"FPS: {int(self.clock.get_fps())}", COLOR_GRID_ACCENT)
             self.screen.blit(fps, (SCREEN_WIDTH - 100, SCREEN_HEIGHT - 30))
     
     def draw_game_over(self):
         """Draw game over screen."""
-        # Darken background - simple rect
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Winner text
-        lines = self.winner_text.split('\n')
-        y_offset = SCREEN_HEIGHT // 2 - len(lines) * 25
-        
-        for i, line in enumerate(lines):
-            font = self.font_large if i == 0 else self.font_medium
-            text = font.render(line, True, COLOR_GOLD if i == 0 else COLOR_TEXT)
-            x = SCREEN_WIDTH // 2 - text.get_width() // 2
-            self.screen.blit(text, (x, y_offset + i * 50))
+        # Darken background - one pre-built overlay
+        self.screen.blit(self._game_over_overlay, (0, 0))
+        
+        # Winner text - rendered only when winner_text changes
+        if self._game_over_text != self.winner_text:
+            lines = self.winner_text.split('\n')
+            y_offset = SCREEN_HEIGHT // 2 - len(lines) * 25
+            
+            self._game_over_lines = []
+            for i, line in enumerate(lines):
+                font = self.font_large if i == 0 else self.font_medium
+                text = font.render(line, True, COLOR_GOLD if i == 0 else COLOR_TEXT)
+                x = SCREEN_WIDTH // 2 - text.get_width() // 2
+                self._game_over_lines.append((text, (x, y_offset + i * 50)))
+            self._game_over_text = self.winner_text
+        
+        for text, pos in self._game_over_lines:
+            self.screen.blit(text, pos)
         
         # Restart hint
-        hint = self.font_small.render("Press R to restart | ESC to quit", True, COLOR_GRID_ACCENT)
+        hint = self._game_over_hint
         self.screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, SCREEN_HEIGHT - 50))
     
     def draw(self):
@@ -1918,7 +2536,7 @@ class GitWarsEngine:
             # Show LAG PENALTY text if bot exceeded timeout
             if tank.last_action == "LAG":
                 pos = self.camera.apply((tank.x, tank.y - 50))
-                lag_txt = self.font_small.render("LAG PENALTY!", True, (255, 50, 50))
+                lag_txt = self.render_text(self.font_small, "LAG PENALTY!", (255, 50, 50))
                 self.screen.blit(lag_txt, (pos[0] - lag_txt.get_width() // 2, pos[1]))
         
         # Draw particles (on top)